@@ -0,0 +1,72 @@
+# cli.py
+"""
+Resumix 命令行入口。
+
+示例：
+    resumix batch --resumes resumes/ --jd jd.txt --output results.jsonl
+"""
+import argparse
+import sys
+
+
+def _run_batch(args) -> int:
+    from resumix.pipeline.batch_pipeline import (
+        BatchPipeline,
+        find_resumes,
+        load_jd_sections,
+    )
+
+    resumes = find_resumes(args.resumes)
+    if not resumes:
+        print(f"未在 {args.resumes} 下找到 PDF 简历", file=sys.stderr)
+        return 1
+
+    pipeline = BatchPipeline(
+        jd_sections=load_jd_sections(args.jd),
+        output_path=args.output,
+        ocr_workers=args.ocr_workers,
+        parse_workers=args.parse_workers,
+        score_workers=args.score_workers,
+        queue_size=args.queue_size,
+    )
+    summary = pipeline.run(resumes, resume=not args.restart)
+    print(
+        f"完成：共 {summary['total']} 份，跳过 {summary['skipped']} 份，"
+        f"成功 {summary['ok']} 份，失败 {summary['error']} 份，"
+        f"耗时 {summary['elapsed']}s -> {args.output}"
+    )
+    return 0 if summary["error"] == 0 else 2
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="resumix", description="AI Resume Helper")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    batch = subparsers.add_parser(
+        "batch", help="批量解析并评分目录下的所有简历，结果写入 JSONL"
+    )
+    batch.add_argument("--resumes", required=True, help="简历 PDF 所在目录（递归）")
+    batch.add_argument("--jd", required=True, help="岗位描述文本文件或 URL")
+    batch.add_argument(
+        "--output", default="results.jsonl", help="JSONL 输出文件（追加写入）"
+    )
+    batch.add_argument("--ocr-workers", type=int, default=2, help="文本提取线程数")
+    batch.add_argument("--parse-workers", type=int, default=1, help="段落解析线程数")
+    batch.add_argument("--score-workers", type=int, default=4, help="LLM 评分线程数")
+    batch.add_argument("--queue-size", type=int, default=16, help="阶段间队列长度")
+    batch.add_argument(
+        "--restart",
+        action="store_true",
+        help="忽略输出文件中已完成的记录，全部重新处理",
+    )
+    batch.set_defaults(func=_run_batch)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -33,14 +33,49 @@ def compare_resume_sections(
     """
     logger.info("Comparing all resume sections using SectionRewriter")
 
-    for section_name, section_obj in sections.items():
+    # Reserve a slot per section so cards keep their order while rewrites
+    # finish in any order
+    slots = {}
+    for section_name in sections:
         st.divider()
+        slots[section_name] = st.empty()
 
-        # Rewrite section if not already rewritten
-        if not getattr(section_obj, "rewritten_text", None):
-            with st.spinner(f"正在润色 [{section_name}] 模块..."):
-                rewriter.rewrite_section(section_obj, jd_content)
+    pending = {}
+    for section_name, section_obj in sections.items():
+        if getattr(section_obj, "rewritten_text", None):
+            _render_slot(
+                slots[section_name], section_name, section_obj, use_card_template
+            )
+        else:
+            slots[section_name].caption(f"正在润色 [{section_name}] 模块...")
+            pending[section_name] = section_obj
+
+    # Rewrite all pending sections concurrently, streaming each into its own
+    # slot and swapping in the comparison view as soon as it completes
+    streamed = {section_name: "" for section_name in pending}
+    for section_name, piece in rewriter.stream_all_iter(pending, jd_content):
+        slot = slots[section_name]
+        if piece is None:
+            _render_slot(slot, section_name, pending[section_name], use_card_template)
+            continue
+        streamed[section_name] += piece
+        with slot.container():
+            st.caption(f"正在润色 [{section_name}] 模块...")
+            st.markdown(streamed[section_name])
+
+
+def _render_slot(
+    slot,
+    section_name: str,
+    section_obj: SectionBase,
+    use_card_template: bool,
+):
+    """Replace a section's placeholder with its comparison view"""
+    if not getattr(section_obj, "rewritten_text", None):
+        slot.warning(f"[{section_name}] 模块润色失败，请稍后重试")
+        return
 
+    with slot.container():
         if use_card_template:
             # Card template version
             _display_comparison_card(section_name, section_obj)
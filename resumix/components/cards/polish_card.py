@@ -59,6 +59,13 @@ def _generate_polish_content(sections: dict, llm_model):
 - 具体改进建议
 - 优化后的示例内容
 """
-            result = llm_model(prompt)
-            st.chat_message("Resumix").write(result)
+            stream = getattr(llm_model, "stream", None)
+            if stream:
+                with st.chat_message("Resumix"):
+                    try:
+                        st.write_stream(stream(prompt))
+                    except Exception as e:
+                        st.error(str(e))
+            else:
+                st.chat_message("Resumix").write(llm_model(prompt))
             st.markdown("---")
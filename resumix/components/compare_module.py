@@ -17,14 +17,19 @@ def compare_resume_sections(
 
     T = LANGUAGES[st.session_state.lang]
 
+    # 未润色过的模块并发调用 Rewriter 润色
+    pending = {
+        name: section
+        for name, section in sections.items()
+        if not getattr(section, "rewritten_text", None)
+    }
+    if pending:
+        with st.spinner(f"正在润色 {len(pending)} 个模块..."):
+            rewriter.rewrite_all(pending, jd_content)
+
     for section_name, section_obj in sections.items():
         st.divider()  # 分隔每个模块
 
-        # 若未润色过，调用 Rewriter 润色
-        if not getattr(section_obj, "rewritten_text", None):
-            with st.spinner(f"正在润色 [{section_name}] 模块..."):
-                rewriter.rewrite_section(section_obj, jd_content)
-
         col1, col2 = st.columns(2)
 
         # 原始内容列
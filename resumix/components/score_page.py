@@ -1,7 +1,6 @@
 import streamlit as st
 from utils.logger import logger
 from typing import Dict
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from resumix.section.section_base import SectionBase
 from resumix.modules.score_module.score_module import ScoreModule
 from resumix.components.cards.score_card import ScoreCard
@@ -18,7 +17,7 @@ class ScorePage(BasePage):
         RESUME_SECTIONS = SessionUtils.get_resume_sections()
         JD_SECTIONS = SessionUtils.get_jd_sections()
 
-        logger.info("开始简历评分分析（非顺序）...")
+        logger.info("开始简历评分分析（批量）...")
 
         score_module = ScoreModule()
 
@@ -29,38 +28,30 @@ class ScorePage(BasePage):
             logger.warning(f"Missing Requirements Basic in JD Sections: {JD_SECTIONS}")
             return
 
-        section_items = list(RESUME_SECTIONS.items())
+        section_items = [
+            (name, section)
+            for name, section in RESUME_SECTIONS.items()
+            if ScoreModule.is_scorable(name)
+        ]
         total = len(section_items)
         progress_bar = st.progress(0)
 
-        with ThreadPoolExecutor(max_workers=6) as executor:
-            future_to_name = {
-                executor.submit(
-                    score_module.score_resume,
-                    section,
-                    JD_SECTIONS["requirements_basic"],
-                    JD_SECTIONS.get("requirements_preferred"),
-                ): name
-                for name, section in section_items
-            }
+        # 一次请求为所有段落评分，解析失败的段落在内部回退为逐段评分
+        with st.spinner("正在批量评分所有简历段落..."):
+            results = score_module.score_resume_batch(
+                RESUME_SECTIONS,
+                JD_SECTIONS["requirements_basic"],
+                JD_SECTIONS.get("requirements_preferred"),
+            )
 
-            finished = 0
-            for future in as_completed(future_to_name):
-                name = future_to_name[future]
-                try:
-                    result = future.result()
-                except Exception as e:
-                    logger.warning(f"[Score] {name} 段落评分失败: {e}")
-                    result = {"error": str(e)}
+        for finished, (name, section) in enumerate(section_items, start=1):
+            result = results.get(name, {"error": "未返回评分结果"})
 
-                # 立即展示（可能无序）
-                section = RESUME_SECTIONS[name]
-                with st.spinner(f"正在展示 {section.name}..."):
-                    score_card = ScoreCard(section.name, result)
-                    score_card.render()
-                    st.markdown("---")
+            with st.spinner(f"正在展示 {section.name}..."):
+                score_card = ScoreCard(section.name, result)
+                score_card.render()
+                st.markdown("---")
 
-                finished += 1
-                progress_bar.progress(finished / total)
+            progress_bar.progress(finished / total)
 
         st.success("所有简历段落评分完成 ✅")
@@ -30,6 +30,8 @@ class LLMConfig:
                 "url": CONFIG.LLM.LOCAL.URL,
                 "model": os.getenv("LOCAL_LLM_MODEL", "gemma3:4b"),
                 "type": "local",
+                "pool_size": getattr(CONFIG.LLM.LOCAL, "POOL_SIZE", 4),
+                "max_concurrency": getattr(CONFIG.LLM.LOCAL, "MAX_CONCURRENCY", 4),
             }
         elif CONFIG.LLM.USE_MODEL == "deepseek":
             logger.info("Using Deepseek API configuration")
@@ -42,6 +44,8 @@ class LLMConfig:
                 "api_key": api_key,
                 "model": "deepseek-chat",
                 "type": "deepseek",
+                "pool_size": getattr(CONFIG.LLM.DEEPSEEK, "POOL_SIZE", 8),
+                "max_concurrency": getattr(CONFIG.LLM.DEEPSEEK, "MAX_CONCURRENCY", 8),
             }
         elif CONFIG.LLM.USE_MODEL == "silicon":
             logger.info("Using Silicon API configuration")
@@ -54,6 +58,8 @@ class LLMConfig:
                 "api_key": api_key,
                 "model": CONFIG.LLM.SILICON.MODEL,
                 "type": "silicon",
+                "pool_size": getattr(CONFIG.LLM.SILICON, "POOL_SIZE", 8),
+                "max_concurrency": getattr(CONFIG.LLM.SILICON, "MAX_CONCURRENCY", 8),
             }
         elif CONFIG.LLM.USE_MODEL == "teleai":
             logger.info("Using TeleAI API configuration")
@@ -68,4 +74,6 @@ class LLMConfig:
                 "username": os.getenv("TELEAI_USERNAME", ""),
                 "api_key": api_key,
                 "type": "teleai",
+                "pool_size": getattr(CONFIG.LLM.TELEAI, "POOL_SIZE", 8),
+                "max_concurrency": getattr(CONFIG.LLM.TELEAI, "MAX_CONCURRENCY", 8),
             }
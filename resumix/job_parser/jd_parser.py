@@ -1,9 +1,10 @@
 import requests
-import chardet
 from bs4 import BeautifulSoup
 import sys
 import os
 
+from resumix.utils.url_fetcher import UrlFetcher
+
 
 class JDParser:
     def __init__(self, llm):
@@ -13,10 +14,9 @@ class JDParser:
         response = requests.get(url, timeout=10)
         response.raise_for_status()
 
-        # 自动检测编码（更强健）
-        detected = chardet.detect(response.content)
-        encoding = detected["encoding"] or "utf-8"
-        html = response.content.decode(encoding, errors="replace")
+        html = UrlFetcher.decode_html(
+            response.content, response.headers.get("Content-Type")
+        )
 
         soup = BeautifulSoup(html, "html.parser")
         tags = soup.find_all(["p", "li", "div", "section"])
@@ -1,10 +1,10 @@
 from resumix.prompt.prompt_dispatcher import PromptDispatcher
+from resumix.prompt.prompt_templates import SCORE_PROMPT_MAP
 from resumix.section.section_base import SectionBase
 from resumix.utils.llm_client import LLMClient
 from resumix.utils.logger import logger
-from typing import Dict
-import streamlit as st
-from resumix.components.cards.score_card import display_score_card
+from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
 from resumix.utils.json_parser import JsonParser
 
 
@@ -50,6 +50,82 @@ class ScoreModule:
             )
             return {"error": "无法解析评分结果", "raw": response}
 
+    def score_resume_batch(
+        self,
+        sections: Dict[str, SectionBase],
+        jd_section_basic: SectionBase,
+        jd_section_preferred: Optional[SectionBase],
+        max_workers: int = 6,
+    ) -> Dict[str, dict]:
+        """
+        一次 LLM 调用为所有简历段落评分，JD 内容只发送一次。
+
+        没有评分 prompt 的段落（见 is_scorable）不参与评分，也不出现在结果中；
+        解析失败（缺失或格式不正确）的段落再回退到 score_resume 单独评分。
+
+        返回：
+            {段落名称: 评分结果字典}
+        """
+        skipped = [name for name in sections if not self.is_scorable(name)]
+        if skipped:
+            logger.info(f"[ScoreModule] 跳过不支持评分的段落: {skipped}")
+            sections = {n: s for n, s in sections.items() if self.is_scorable(n)}
+        if not sections:
+            return {}
+
+        prompt = self.prompt_dispatcher.get_batch_score_prompt(
+            sections, jd_section_basic, jd_section_preferred
+        )
+        response = self.llm(prompt=prompt)
+
+        logger.debug(f"Batch score prompt: {prompt}")
+        logger.debug(f"Batch score response: {response}")
+
+        parsed = JsonParser.parse(response)
+        if not isinstance(parsed, dict):
+            parsed = {}
+
+        results: Dict[str, dict] = {}
+        failed = []
+        for name in sections:
+            result = parsed.get(name)
+            if self._is_valid_score(result):
+                results[name] = result
+            else:
+                failed.append(name)
+
+        if failed:
+            logger.warning(f"[ScoreModule] 批量评分解析失败，逐段回退: {failed}")
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(failed))) as ex:
+                futures = {
+                    name: ex.submit(
+                        self.score_resume,
+                        sections[name],
+                        jd_section_basic,
+                        jd_section_preferred,
+                    )
+                    for name in failed
+                }
+                for name, future in futures.items():
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        logger.warning(f"[ScoreModule] {name} 段落评分失败: {e}")
+                        results[name] = {"error": str(e)}
+
+        return {name: results[name] for name in sections}
+
+    @staticmethod
+    def is_scorable(section_name: str) -> bool:
+        """段落是否有对应的评分 prompt"""
+        return section_name in SCORE_PROMPT_MAP
+
+    @staticmethod
+    def _is_valid_score(result) -> bool:
+        return isinstance(result, dict) and any(
+            isinstance(v, (int, float)) for v in result.values()
+        )
+
 
 if __name__ == "__main__":
     score_module = ScoreModule()
@@ -0,0 +1,297 @@
+# pipeline/batch_pipeline.py
+import json
+import os
+import queue
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Set
+
+from resumix.config.config import Config
+from resumix.section.section_base import SectionBase
+from resumix.utils.logger import logger
+
+CONFIG = Config().config
+
+# 阶段结束标记：worker 收到后放回队列再退出，使同一阶段的其他 worker 也能看到
+_DONE = object()
+
+
+class BatchPipeline:
+    """
+    无界面的批量简历筛选流水线：OCR → 段落解析 → LLM 评分 → JSONL。
+
+    - 每个阶段独立的线程池，阶段之间使用有界队列，慢阶段会反压上游；
+    - 每完成一份简历立即追加一行 JSONL 并刷盘；
+    - 重新运行时跳过输出文件中已成功的简历，失败的简历会被重试。
+    """
+
+    def __init__(
+        self,
+        jd_sections: Dict[str, SectionBase],
+        output_path: str,
+        ocr_workers: int = 2,
+        parse_workers: int = 1,
+        score_workers: int = 4,
+        queue_size: int = 16,
+    ):
+        """
+        参数：
+            jd_sections: 已解析的 JD 段落，需包含 requirements_basic
+            output_path: JSONL 输出文件路径
+            ocr_workers: 文本提取线程数
+            parse_workers: 段落解析线程数
+            score_workers: LLM 评分线程数
+            queue_size: 阶段间队列的最大长度
+        """
+        if "requirements_basic" not in jd_sections:
+            raise ValueError("JD 段落缺少 requirements_basic，无法评分。")
+
+        self.jd_basic = jd_sections["requirements_basic"]
+        self.jd_preferred = jd_sections.get("requirements_preferred")
+        self.output_path = output_path
+        self.ocr_workers = max(1, ocr_workers)
+        self.parse_workers = max(1, parse_workers)
+        self.score_workers = max(1, score_workers)
+        self.queue_size = queue_size
+        self._local = threading.local()
+
+    # ---------- 各阶段处理函数 ----------
+
+    def _extract(self, job: dict) -> dict:
+        from resumix.utils.ocr_pool import OCREnginePool
+        from resumix.utils.ocr_utils import OCRUtils
+
+        # OCRUtils 记录逐页报告，每个线程各持有一个实例
+        ocr = getattr(self._local, "ocr", None)
+        if ocr is None:
+            ocr = self._local.ocr = OCRUtils(
+                ocr_pool=OCREnginePool(),
+                dpi=getattr(CONFIG.OCR, "DPI", 100),
+                page_workers=1,
+            )
+
+        with open(job["path"], "rb") as f:
+            content = f.read()
+        job["text"] = ocr.extract_text(
+            content, max_pages=getattr(CONFIG.OCR, "MAX_PAGES", None)
+        )
+        job["pages"] = [dict(entry) for entry in ocr.page_report]
+        return job
+
+    def _parse(self, job: dict) -> dict:
+        from resumix.section_parser.vector_parser import VectorParser
+
+        # 模型与缓存通过 EmbeddingRegistry 在进程内共享，构造开销很小
+        parser = getattr(self._local, "parser", None)
+        if parser is None:
+            parser = self._local.parser = VectorParser()
+        job["sections"] = parser.parse_resume(job.pop("text"))
+        return job
+
+    def _score(self, job: dict) -> dict:
+        from resumix.modules.score_module.score_module import ScoreModule
+
+        # 没有评分 prompt 的段落不评分，记录下来而不是让整份简历失败
+        job["skipped_sections"] = [
+            name for name in job["sections"] if not ScoreModule.is_scorable(name)
+        ]
+        scores = ScoreModule().score_resume_batch(
+            job["sections"], self.jd_basic, self.jd_preferred
+        )
+        # LLM 不可用时评分结果为 {"error": ...}，记为失败以便下次续跑时重试
+        failed = [
+            name
+            for name, result in scores.items()
+            if not isinstance(result, dict) or "error" in result
+        ]
+        if failed:
+            raise ValueError(f"段落评分失败: {', '.join(failed)}")
+        job["scores"] = scores
+        return job
+
+    # ---------- 流水线调度 ----------
+
+    def _worker(
+        self,
+        stage: str,
+        fn: Callable[[dict], dict],
+        in_q: queue.Queue,
+        out_q: queue.Queue,
+    ):
+        while True:
+            job = in_q.get()
+            if job is _DONE:
+                in_q.put(_DONE)
+                return
+            if "error" not in job:
+                start = time.time()
+                try:
+                    job = fn(job)
+                except Exception as e:
+                    logger.warning(f"[BatchPipeline] {stage} 失败 {job['path']}: {e}")
+                    job["error"] = str(e)
+                    job["stage"] = stage
+                job.setdefault("timings", {})[stage] = round(time.time() - start, 3)
+            out_q.put(job)
+
+    def _start_stage(
+        self,
+        stage: str,
+        fn: Callable[[dict], dict],
+        workers: int,
+        in_q: queue.Queue,
+        out_q: queue.Queue,
+    ) -> List[threading.Thread]:
+        threads = [
+            threading.Thread(
+                target=self._worker,
+                args=(stage, fn, in_q, out_q),
+                name=f"{stage}-{i}",
+                daemon=True,
+            )
+            for i in range(workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        # 本阶段所有 worker 退出后，再向下游发送结束标记
+        def close():
+            for thread in threads:
+                thread.join()
+            out_q.put(_DONE)
+
+        threading.Thread(target=close, name=f"{stage}-close", daemon=True).start()
+        return threads
+
+    def completed(self) -> Set[str]:
+        """读取输出文件中已成功处理的简历路径，用于断点续跑"""
+        done = set()
+        if not os.path.exists(self.output_path):
+            return done
+        with open(self.output_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 上次中断时写了一半的行
+                if record.get("status") == "ok":
+                    done.add(record["resume"])
+        return done
+
+    def _ends_mid_line(self) -> bool:
+        if not os.path.exists(self.output_path):
+            return False
+        with open(self.output_path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return False
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b"\n"
+
+    def _to_record(self, job: dict) -> dict:
+        record = {
+            "resume": job["path"],
+            "status": "error" if "error" in job else "ok",
+            "timings": job.get("timings", {}),
+            "pages": job.get("pages", []),
+        }
+        if "error" in job:
+            record["stage"] = job["stage"]
+            record["error"] = job["error"]
+        else:
+            record["sections"] = {
+                name: section.to_dict() for name, section in job["sections"].items()
+            }
+            record["scores"] = job["scores"]
+            record["skipped_sections"] = job.get("skipped_sections", [])
+        return record
+
+    def run(self, resume_paths: Iterable[str], resume: bool = True) -> dict:
+        """
+        处理一批简历，结果逐行追加到 output_path。
+
+        参数：
+            resume_paths: 简历 PDF 路径
+            resume: 是否跳过输出文件中已成功的简历
+
+        返回：
+            {"total": n, "skipped": n, "ok": n, "error": n, "elapsed": 秒}
+        """
+        paths = list(resume_paths)
+        done = self.completed() if resume else set()
+        pending = [path for path in paths if path not in done]
+        summary = {"total": len(paths), "skipped": len(paths) - len(pending)}
+        logger.info(
+            f"[BatchPipeline] 共 {len(paths)} 份简历，"
+            f"跳过已完成 {summary['skipped']} 份，待处理 {len(pending)} 份"
+        )
+
+        path_q = queue.Queue(maxsize=self.queue_size)
+        text_q = queue.Queue(maxsize=self.queue_size)
+        section_q = queue.Queue(maxsize=self.queue_size)
+        result_q = queue.Queue(maxsize=self.queue_size)
+
+        self._start_stage("ocr", self._extract, self.ocr_workers, path_q, text_q)
+        self._start_stage("parse", self._parse, self.parse_workers, text_q, section_q)
+        self._start_stage("score", self._score, self.score_workers, section_q, result_q)
+
+        def feed():
+            for path in pending:
+                path_q.put({"path": path})
+            path_q.put(_DONE)
+
+        threading.Thread(target=feed, name="feed", daemon=True).start()
+
+        start = time.time()
+        counts = {"ok": 0, "error": 0}
+        os.makedirs(os.path.dirname(os.path.abspath(self.output_path)), exist_ok=True)
+        with open(self.output_path, "a", encoding="utf-8") as out:
+            if self._ends_mid_line():
+                # 上次中断时留下半行，先换行，避免第一条新记录与之拼接而无法解析
+                out.write("\n")
+            while True:
+                job = result_q.get()
+                if job is _DONE:
+                    break
+                record = self._to_record(job)
+                out.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+                out.flush()
+                counts[record["status"]] += 1
+
+                finished = counts["ok"] + counts["error"]
+                elapsed = time.time() - start
+                logger.info(
+                    f"[BatchPipeline] {finished}/{len(pending)} "
+                    f"{record['status']}: {record['resume']} "
+                    f"({finished / elapsed:.2f} 份/秒)"
+                )
+
+        summary.update(counts)
+        summary["elapsed"] = round(time.time() - start, 2)
+        logger.info(f"[BatchPipeline] 完成: {summary}")
+        return summary
+
+
+def load_jd_sections(jd: str) -> Dict[str, SectionBase]:
+    """
+    读取并解析 JD：jd 为 URL 时抓取网页，否则作为本地文本文件读取。
+    """
+    from resumix.section_parser.jd_vector_parser import JDVectorParser
+    from resumix.utils.url_fetcher import UrlFetcher
+
+    if jd.startswith(("http://", "https://")):
+        jd_text = UrlFetcher.fetch(jd)
+    else:
+        with open(jd, "r", encoding="utf-8") as f:
+            jd_text = f.read()
+    return JDVectorParser().parse(jd_text)
+
+
+def find_resumes(directory: str, suffix: str = ".pdf") -> List[str]:
+    """递归列出目录下的简历文件（按路径排序，保证多次运行顺序一致）"""
+    paths = []
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if name.lower().endswith(suffix):
+                paths.append(os.path.join(root, name))
+    return sorted(paths)
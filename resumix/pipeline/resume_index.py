@@ -0,0 +1,292 @@
+# pipeline/resume_index.py
+import json
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from resumix.section.section_base import SectionBase
+from resumix.utils.embedding_registry import EmbeddingRegistry
+from resumix.utils.logger import logger
+
+try:
+    import hnswlib
+except ImportError:
+    hnswlib = None
+
+
+# JD 段落在排序中的权重，未列出的段落不参与匹配
+JD_SECTION_WEIGHTS = {
+    "requirements_basic": 1.0,
+    "requirements_preferred": 0.5,
+    "responsibilities": 0.5,
+}
+
+
+class ResumeIndex:
+    """
+    简历 → JD 语义匹配索引，用于在大量候选人中先行筛选，再交给 LLM 精细评分。
+
+    - 每份简历的每个段落存为一行 L2 归一化的 float16 向量（段落内各行向量的均值）；
+    - 排序分数：对每个 JD 段落取简历各段落的最大余弦相似度，再按 JD_SECTION_WEIGHTS 加权平均；
+    - 安装 hnswlib 时使用 HNSW 近邻检索召回候选简历，再精确打分；否则退化为矩阵暴力计算。
+    """
+
+    def __init__(
+        self,
+        model_name: str = "paraphrase-multilingual-MiniLM-L12-v2",
+        use_ann: bool = True,
+        ann_oversample: int = 10,
+    ):
+        """
+        参数：
+            model_name: 句向量模型名称
+            use_ann: 是否在可用时使用 hnswlib 近邻检索
+            ann_oversample: 近邻召回的段落数相对 top_k 的倍数
+        """
+        self.model_name = model_name
+        self.use_ann = use_ann and hnswlib is not None
+        self.ann_oversample = ann_oversample
+        self.resume_ids: List[str] = []
+        self.section_names: List[str] = []
+        self.owners = np.zeros(0, dtype=np.int32)  # 每行向量所属简历的下标
+        self.matrix: Optional[np.ndarray] = None
+        self._pending: List[np.ndarray] = []
+        self._pending_owners: List[int] = []
+        self._ann = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.resume_ids)
+
+    def _embed_sections(
+        self, sections: Dict[str, SectionBase]
+    ) -> Tuple[List[str], np.ndarray]:
+        names, texts, owners = [], [], []
+        for name, section in sections.items():
+            lines = section.lines or [section.raw_text]
+            lines = [line for line in lines if line.strip()]
+            if not lines:
+                continue
+            names.append(name)
+            texts.extend(lines)
+            owners.extend([len(names) - 1] * len(lines))
+
+        if not names:
+            return [], np.zeros((0, 0), dtype=np.float16)
+
+        line_vecs = EmbeddingRegistry.embed(
+            texts,
+            model_name=self.model_name,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )
+        owners = np.asarray(owners)
+        vectors = np.stack(
+            [line_vecs[owners == i].mean(axis=0) for i in range(len(names))]
+        )
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-12
+        return names, vectors.astype(np.float16)
+
+    def add(self, resume_id: str, sections: Dict[str, SectionBase]):
+        """
+        加入一份解析后的简历（VectorParser.parse_resume 的输出）。
+        """
+        names, vectors = self._embed_sections(sections)
+        if not names:
+            logger.warning(f"[ResumeIndex] 简历没有可索引的段落: {resume_id}")
+            return
+        with self._lock:
+            owner = len(self.resume_ids)
+            self.resume_ids.append(resume_id)
+            self.section_names.extend(names)
+            self._pending.append(vectors)
+            self._pending_owners.extend([owner] * len(names))
+
+    def _consolidate(self):
+        # 新增向量先暂存，查询前一次性合并，避免每次 add 都复制整个矩阵
+        with self._lock:
+            if not self._pending:
+                return
+            start = 0 if self.matrix is None else len(self.matrix)
+            new_vectors = np.concatenate(self._pending)
+            self.matrix = (
+                new_vectors
+                if self.matrix is None
+                else np.concatenate([self.matrix, new_vectors])
+            )
+            self.owners = np.concatenate(
+                [self.owners, np.asarray(self._pending_owners, dtype=np.int32)]
+            )
+            self._pending, self._pending_owners = [], []
+
+            if self.use_ann:
+                self._ann_add(new_vectors, start)
+
+    def _ann_add(self, vectors: np.ndarray, start: int):
+        if self._ann is None:
+            self._ann = hnswlib.Index(space="ip", dim=vectors.shape[1])
+            self._ann.init_index(
+                max_elements=max(1024, len(self.matrix)), ef_construction=200, M=16
+            )
+        elif len(self.matrix) > self._ann.get_max_elements():
+            self._ann.resize_index(
+                max(len(self.matrix), 2 * self._ann.get_max_elements())
+            )
+        self._ann.add_items(
+            vectors.astype(np.float32), np.arange(start, start + len(vectors))
+        )
+
+    def _jd_vectors(
+        self, jd_sections: Dict[str, SectionBase]
+    ) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        names, vectors = self._embed_sections(
+            {n: s for n, s in jd_sections.items() if n in JD_SECTION_WEIGHTS}
+        )
+        if not names:
+            # JD 未识别出要求类段落时，使用全部段落等权匹配
+            names, vectors = self._embed_sections(jd_sections)
+            weights = np.ones(len(names), dtype=np.float32)
+        else:
+            weights = np.asarray(
+                [JD_SECTION_WEIGHTS[n] for n in names], dtype=np.float32
+            )
+        return names, vectors.astype(np.float32), weights / weights.sum()
+
+    def _candidates(self, jd_vecs: np.ndarray, top_k: int) -> Optional[np.ndarray]:
+        if self._ann is None:
+            return None
+        k = min(len(self.matrix), top_k * self.ann_oversample)
+        self._ann.set_ef(max(k, 64))
+        labels, _ = self._ann.knn_query(jd_vecs, k=k)
+        return np.unique(self.owners[labels.ravel()])
+
+    def rank(
+        self, jd_sections: Dict[str, SectionBase], top_k: int = 50
+    ) -> List[Tuple[str, float, Dict[str, str]]]:
+        """
+        按与 JD 的语义匹配度对简历排序。
+
+        参数：
+            jd_sections: JDVectorParser.parse 的输出
+            top_k: 返回的简历数量
+
+        返回：
+            [(resume_id, 分数, {JD 段落: 最匹配的简历段落}), ...]，按分数降序。
+        """
+        self._consolidate()
+        if self.matrix is None or not len(self.matrix):
+            return []
+
+        jd_names, jd_vecs, weights = self._jd_vectors(jd_sections)
+        if not jd_names:
+            return []
+
+        candidates = self._candidates(jd_vecs, top_k)
+        if candidates is None:
+            rows = np.arange(len(self.matrix))
+        else:
+            rows = np.flatnonzero(np.isin(self.owners, candidates))
+
+        # rows × jd 段落的相似度，再按简历分组取每个 JD 段落的最大值
+        sims = self.matrix[rows].astype(np.float32) @ jd_vecs.T
+        owners = self.owners[rows]
+        order = np.argsort(owners, kind="stable")
+        owners, sims, rows = owners[order], sims[order], rows[order]
+        unique_owners, starts = np.unique(owners, return_index=True)
+        best = np.maximum.reduceat(sims, starts, axis=0)
+        scores = best @ weights
+
+        top = np.argsort(-scores, kind="stable")[:top_k]
+        results = []
+        for i in top:
+            start = starts[i]
+            end = starts[i + 1] if i + 1 < len(starts) else len(rows)
+            best_rows = rows[start + np.argmax(sims[start:end], axis=0)]
+            matches = {
+                jd_name: self.section_names[row]
+                for jd_name, row in zip(jd_names, best_rows)
+            }
+            results.append(
+                (self.resume_ids[unique_owners[i]], float(scores[i]), matches)
+            )
+        return results
+
+    def model_key(self) -> str:
+        """生成向量所用的模型与推理后端，不同后端的向量不可混用"""
+        return EmbeddingRegistry.model_key(self.model_name)
+
+    def save(self, directory: str):
+        """
+        保存为 vectors.npy + meta.json，可用 load 以内存映射方式加载。
+        meta.json 记录模型标识与向量维度，load 时据此拒绝不兼容的索引。
+        """
+        self._consolidate()
+        os.makedirs(directory, exist_ok=True)
+        matrix = (
+            self.matrix if self.matrix is not None else np.zeros((0, 0), np.float16)
+        )
+        np.save(os.path.join(directory, "vectors.npy"), matrix)
+        with open(os.path.join(directory, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "model": self.model_name,
+                    "model_key": self.model_key(),
+                    "dim": int(matrix.shape[1]),
+                    "resume_ids": self.resume_ids,
+                    "section_names": self.section_names,
+                    "owners": self.owners.tolist(),
+                },
+                f,
+                ensure_ascii=False,
+            )
+        logger.info(f"[ResumeIndex] 已保存 {len(self)} 份简历索引: {directory}")
+
+    @classmethod
+    def load(
+        cls, directory: str, use_ann: bool = True, model_name: Optional[str] = None
+    ) -> "ResumeIndex":
+        """
+        加载 save 保存的索引。
+
+        参数：
+            directory: 索引目录
+            use_ann: 是否在可用时使用 hnswlib 近邻检索
+            model_name: 期望的模型名称，为 None 时使用索引中记录的模型
+
+        异常：
+            ValueError：索引缺少模型信息，或与当前模型 / 推理后端 / 向量维度不一致，
+            此时需要用当前模型重新建立索引。
+        """
+        with open(os.path.join(directory, "meta.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if "model_key" not in meta or "dim" not in meta:
+            raise ValueError(f"索引缺少模型信息，请重新建立索引: {directory}")
+
+        index = cls(model_name=model_name or meta["model"], use_ann=use_ann)
+        if meta["model_key"] != index.model_key():
+            raise ValueError(
+                f"索引由 {meta['model_key']} 生成，与当前模型 {index.model_key()} 不一致"
+            )
+
+        matrix = np.load(os.path.join(directory, "vectors.npy"), mmap_mode="r")
+        if len(matrix):
+            dim = EmbeddingRegistry.get_model(
+                index.model_name
+            ).get_sentence_embedding_dimension()
+            if matrix.shape[1] != meta["dim"] or dim != meta["dim"]:
+                raise ValueError(
+                    f"索引向量维度 {matrix.shape[1]}（记录为 {meta['dim']}）"
+                    f"与模型维度 {dim} 不一致"
+                )
+
+        index.resume_ids = meta["resume_ids"]
+        index.section_names = meta["section_names"]
+        index.owners = np.asarray(meta["owners"], dtype=np.int32)
+        if len(matrix):
+            index.matrix = matrix
+            if index.use_ann:
+                index._ann_add(np.asarray(matrix), 0)
+        logger.info(f"[ResumeIndex] 已加载 {len(index)} 份简历索引: {directory}")
+        return index
@@ -1,5 +1,10 @@
 # dispatcher/prompt_dispatcher.py
-from resumix.prompt.prompt_templates import PROMPT_MAP, SCORE_PROMPT_MAP
+from typing import Dict
+from resumix.prompt.prompt_templates import (
+    PROMPT_MAP,
+    SCORE_PROMPT_MAP,
+    BATCH_SCORE_PROMPT,
+)
 from resumix.section.section_base import SectionBase
 
 
@@ -31,7 +36,9 @@ class PromptDispatcher:
         """
         用于评分的 prompt 构造
         """
-        prompt = SCORE_PROMPT_MAP[section.name]
+        prompt = SCORE_PROMPT_MAP.get(section.name)
+        if not prompt:
+            raise ValueError(f"No score prompt found for section: {section.name}")
         placeholder = "<CV_TEXT>"
         jd_basic_placeholder = "<JD_BASIC_TEXT>"
         jd_preferred_placeholder = "<JD_PREFERRED_TEXT>"
@@ -48,6 +55,30 @@ class PromptDispatcher:
 
         return prompt
 
+    def get_batch_score_prompt(
+        self,
+        sections: Dict[str, SectionBase],
+        jd_section_basic: SectionBase,
+        jd_section_preferred: SectionBase,
+    ) -> str:
+        """
+        用于批量评分的 prompt 构造：JD 只出现一次，所有段落按名称依次排列
+        """
+        cv_sections = "\n\n".join(
+            f"### Section: {name}\n{section.raw_text.strip()}"
+            for name, section in sections.items()
+        )
+
+        prompt = BATCH_SCORE_PROMPT.replace("<CV_SECTIONS>", cv_sections)
+        prompt = prompt.replace("<SECTION_NAMES>", ", ".join(sections.keys()))
+        prompt = prompt.replace("<JD_BASIC_TEXT>", jd_section_basic.raw_text.strip())
+        prompt = prompt.replace(
+            "<JD_PREFERRED_TEXT>",
+            jd_section_preferred.raw_text.strip() if jd_section_preferred else "",
+        )
+
+        return prompt
+
     def get_tailoring_prompt(self, full_cv: str) -> str:
         """
         用于整体润色的 prompt 构造
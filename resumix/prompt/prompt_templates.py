@@ -141,7 +141,31 @@ PROMPT_MAP = {
     "tailor": TAILORING_PROMPT,
 }
 
-PROJECTS_SCORE_PROMPT = """
+# 单段评分与批量评分共用的评分维度与输出结构
+SCORE_DIMENSIONS = """
+### Evaluation Dimensions:
+- **Completeness**: Does the section provide complete and sufficient information?
+- **Clarity**: Is the writing clear, organized, and easy to follow?
+- **Relevance**: Does the content align with the basic and preferred requirements?
+- **Professional Language**: Does the candidate use appropriate technical and formal language?
+- **Achievement-Oriented**: Are accomplishments and results emphasized?
+- **Quantitative Support**: Are there any numbers, data, or measurable indicators?
+"""
+
+SCORE_RESULT_INTERFACE = """
+interface ScoreResult {
+  "Completeness": int;
+  "Clarity": int;
+  "Relevance": int;
+  "ProfessionalLanguage": int;
+  "AchievementOriented": int;
+  "QuantitativeSupport": int;
+  "Comment": str;
+}
+"""
+
+PROJECTS_SCORE_PROMPT = (
+    """
 You are a professional HR analyst.
 Please evaluate the following **resume section** based on the provided **job description** and rate it from 0 to 10 across six key criteria.
 
@@ -161,36 +185,60 @@ Please evaluate the following **resume section** based on the provided **job des
 Score the section on a scale from 0 to 10 for each dimension below.
 Give an integer score and concise explanation.
 If a dimension is not applicable, assign 0 and explain why.
-
-### Evaluation Dimensions:
-- **Completeness**: Does the section provide complete and sufficient information?
-- **Clarity**: Is the writing clear, organized, and easy to follow?
-- **Relevance**: Does the content align with the basic and preferred requirements?
-- **Professional Language**: Does the candidate use appropriate technical and formal language?
-- **Achievement-Oriented**: Are accomplishments and results emphasized?
-- **Quantitative Support**: Are there any numbers, data, or measurable indicators?
-
+"""
+    + SCORE_DIMENSIONS
+    + """
 At the end, give a concise **comment** summarizing strengths and improvement suggestions.
 
 ## Output JSON Format
 
 You must return **only** valid JSON in the following format:
-
-interface ScoreResult {
-  "Completeness": int;
-  "Clarity": int;
-  "Relevance": int;
-  "ProfessionalLanguage": int;
-  "AchievementOriented": int;
-  "QuantitativeSupport": int;
-  "Comment": str;
-}
 """
+    + SCORE_RESULT_INTERFACE
+)
 
+# 解析器可能产出的全部简历段落；未列出的段落不参与评分
 SCORE_PROMPT_MAP = {
     "personal_info": PROJECTS_SCORE_PROMPT,
     "education": PROJECTS_SCORE_PROMPT,
     "experience": PROJECTS_SCORE_PROMPT,
     "projects": PROJECTS_SCORE_PROMPT,
     "skills": PROJECTS_SCORE_PROMPT,
+    "awards": PROJECTS_SCORE_PROMPT,
 }
+
+BATCH_SCORE_PROMPT = (
+    """
+You are a professional HR analyst.
+Please evaluate **each resume section** below based on the provided **job description** and rate every section from 0 to 10 across six key criteria.
+
+## Job Description
+
+**Basic Requirements**:
+<JD_BASIC_TEXT>
+
+**Preferred Requirements**:
+<JD_PREFERRED_TEXT>
+
+## Resume Sections:
+<CV_SECTIONS>
+
+## Evaluation Instructions:
+
+Score every section independently on a scale from 0 to 10 for each dimension below.
+Give an integer score and concise explanation.
+If a dimension is not applicable, assign 0 and explain why.
+"""
+    + SCORE_DIMENSIONS
+    + """
+For each section, give a concise **comment** summarizing strengths and improvement suggestions.
+
+## Output JSON Format
+
+You must return **only** valid JSON: one top-level key per section name listed above (<SECTION_NAMES>), each mapping to a ScoreResult:
+"""
+    + SCORE_RESULT_INTERFACE
+    + """
+type BatchScoreResult = Record<string, ScoreResult>;
+"""
+)
@@ -1,6 +1,7 @@
 from typing import List, Tuple
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sentence_transformers import SentenceTransformer, util
+from sentence_transformers import util
+from resumix.utils.embedding_registry import EmbeddingRegistry
 import re
 
 
@@ -8,7 +9,9 @@ class KeywordController:
     def __init__(self, use_embedding: bool = False):
         self.use_embedding = use_embedding
         self.model = (
-            SentenceTransformer("paraphrase-MiniLM-L6-v2") if use_embedding else None
+            EmbeddingRegistry.get_model("paraphrase-MiniLM-L6-v2")
+            if use_embedding
+            else None
         )
 
     def extract_keywords(self, text: str, top_k: int = 10) -> List[str]:
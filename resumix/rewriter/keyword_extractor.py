@@ -2,7 +2,8 @@ from keybert import KeyBERT
 from typing import List, Tuple
 import re
 import threading
-from sentence_transformers import util, SentenceTransformer
+from sentence_transformers import util
+from resumix.utils.embedding_registry import EmbeddingRegistry
 
 
 class KeywordExtractor:
@@ -21,8 +22,9 @@ class KeywordExtractor:
         """
         初始化 KeyBERT 模型。只会在首次创建实例时执行。
         """
-        self.model = KeyBERT(model_name)
-        self.embedder = SentenceTransformer(model_name)
+        # KeyBERT 与相似度计算共用同一个已加载的句向量模型
+        self.embedder = EmbeddingRegistry.get_model(model_name)
+        self.model = KeyBERT(model=self.embedder)
 
     def extract_keywords(
         self,
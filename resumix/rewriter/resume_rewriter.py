@@ -1,4 +1,6 @@
-from typing import Dict
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, Optional, Tuple
 from loguru import logger
 from prompt.prompt_dispatcher import PromptDispatcher
 from section.section_base import SectionBase
@@ -17,13 +19,115 @@ class ResumeRewriter:
         # 调用 LLM 接口
         rewritten_text = self.llm(prompt)
 
+        # LLMClient 调用失败时不抛异常，而是返回以 ❌ 开头的错误信息
+        if rewritten_text.strip().startswith("❌"):
+            raise RuntimeError(rewritten_text.strip())
+
         # 写入回 section 对象
         section.rewritten_text = rewritten_text.strip()
+        return section
+
+    def stream_section(self, section: SectionBase, jd_text: str = "") -> Iterator[str]:
+        """
+        流式润色：逐段产出模型输出，结束后写入 section.rewritten_text。
+        若 llm 不支持 stream，则一次性产出完整结果。
+        """
+        prompt = self.dispatcher.get_prompt(section)
+        logger.info(f"Streaming rewrite of section '{section.name}' with LLM...")
+
+        stream = getattr(self.llm, "stream", None)
+        if stream:
+            pieces = stream(prompt)
+        else:
+            text = self.llm(prompt)
+            if text.strip().startswith("❌"):
+                raise RuntimeError(text.strip())
+            pieces = [text]
+
+        chunks = []
+        for piece in pieces:
+            chunks.append(piece)
+            yield piece
+
+        section.rewritten_text = "".join(chunks).strip()
+
+    def rewrite_all_iter(
+        self,
+        sections: Dict[str, SectionBase],
+        jd_text: str = "",
+        max_workers: int = 6,
+    ) -> Iterator[Tuple[str, SectionBase]]:
+        """
+        并发润色所有段落，按完成顺序产出 (段落名称, 段落)。
+
+        同时在途的 LLM 请求数不超过 max_workers；润色失败的段落同样会产出，
+        但不设置 rewritten_text。
+        """
+        if not sections:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(sections))) as ex:
+            futures = {
+                ex.submit(self.rewrite_section, section, jd_text): name
+                for name, section in sections.items()
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.warning(f"[ResumeRewriter] {name} 段落润色失败: {e}")
+                yield name, sections[name]
+
+    def stream_all_iter(
+        self,
+        sections: Dict[str, SectionBase],
+        jd_text: str = "",
+        max_workers: int = 6,
+    ) -> Iterator[Tuple[str, Optional[str]]]:
+        """
+        并发流式润色所有段落。
+
+        各段落在工作线程中消费 stream_section，片段经队列交回调用线程，
+        按到达顺序产出 (段落名称, 片段)；段落结束（成功或失败）时产出
+        (段落名称, None)。调用线程可据此安全地更新 Streamlit 占位符。
+        """
+        if not sections:
+            return
+
+        events: "queue.Queue[Tuple[str, Optional[str]]]" = queue.Queue()
+
+        def drain(name: str, section: SectionBase):
+            try:
+                for piece in self.stream_section(section, jd_text):
+                    events.put((name, piece))
+            except Exception as e:
+                logger.warning(f"[ResumeRewriter] {name} 段落润色失败: {e}")
+            finally:
+                events.put((name, None))
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(sections))) as ex:
+            for name, section in sections.items():
+                ex.submit(drain, name, section)
+
+            remaining = len(sections)
+            while remaining:
+                name, piece = events.get()
+                if piece is None:
+                    remaining -= 1
+                yield name, piece
 
     def rewrite_all(
-        self, sections: Dict[str, SectionBase], jd_text: str = ""
+        self,
+        sections: Dict[str, SectionBase],
+        jd_text: str = "",
+        max_workers: int = 6,
     ) -> Dict[str, SectionBase]:
-        rewritten = {}
-        for name, section in sections.items():
-            rewritten[name] = self.rewrite_section(section, jd_text)
-        return rewritten
+        """
+        并发润色所有段落。
+
+        返回：
+            {段落名称: 润色后的段落}，顺序与输入一致。
+        """
+        rewritten = dict(self.rewrite_all_iter(sections, jd_text, max_workers))
+        return {name: rewritten[name] for name in sections}
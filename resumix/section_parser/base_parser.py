@@ -1,9 +1,13 @@
 from typing import Dict, List, Tuple, Union
 from abc import ABC, abstractmethod
-from sentence_transformers import SentenceTransformer, util
 import heapq
-from collections import defaultdict
+import threading
+from collections import OrderedDict, defaultdict
 from resumix.utils.logger import logger
+from resumix.utils.embedding_registry import EmbeddingRegistry
+from resumix.utils.embedding_cache import LineEmbeddingCache
+from resumix.section_parser.label_embeddings import LabelEmbeddings
+from resumix.section_parser.keyword_matcher import KeywordMatcher
 
 
 class BaseParser(ABC):
@@ -12,14 +16,23 @@ class BaseParser(ABC):
         section_labels: Dict[str, List[str]],
         model_name: str = "paraphrase-multilingual-MiniLM-L12-v2",
         threshold: float = 0.65,
+        header_cache_size: int = 4096,
     ):
         self.section_labels = section_labels
-        self.model = SentenceTransformer(model_name)
+        self.model = EmbeddingRegistry.get_model(model_name)
+        model_key = EmbeddingRegistry.model_key(model_name)
         self.threshold = threshold
-        self.label_embeddings = {
-            tag: self.model.encode(labels, convert_to_tensor=True)
-            for tag, labels in section_labels.items()
-        }
+        self.label_embeddings = LabelEmbeddings.load(
+            self.model, model_key, section_labels
+        )
+        self.keyword_matcher = KeywordMatcher(section_labels)
+        self.line_cache = LineEmbeddingCache.for_model(self.model, model_key)
+        # 跨调用的行分类结果 LRU，键为行文本
+        self.header_cache_size = header_cache_size
+        self._header_cache: "OrderedDict[str, Tuple[Union[str, None], float]]" = (
+            OrderedDict()
+        )
+        self._header_cache_lock = threading.Lock()
 
     def normalize_text(self, text: str, keep_blank: bool = False) -> List[str]:
         lines = text.splitlines()
@@ -32,24 +45,39 @@ class BaseParser(ABC):
     def vector_classify_line(self, line: str) -> Tuple[Union[str, None], float]:
         if not line.strip():
             return None, 0.0
-        line_vec = self.model.encode(line, convert_to_tensor=True)
-        best_tag = None
-        best_score = -1
-        for tag, tag_vecs in self.label_embeddings.items():
-            score = util.cos_sim(line_vec, tag_vecs).max().item()
-            if score > best_score:
-                best_score = score
-                best_tag = tag
-        return best_tag, best_score
+        if self.line_cache is not None:
+            line_vec = self.line_cache.encode_one(line)
+        else:
+            line_vec = self.model.encode(line, convert_to_tensor=True)
+        return self.label_embeddings.best_tags(line_vec)[0]
 
     def is_section_header(self, line: str) -> Tuple[Union[str, None], float]:
-        for tag, keywords in self.section_labels.items():
-            for kw in keywords:
-                if kw.lower() in line.lower():
-                    return tag, 1.0
+        tag = self.keyword_matcher.match(line)
+        if tag is not None:
+            return tag, 1.0
         tag, score = self.vector_classify_line(line)
         return (tag, score) if score >= self.threshold else (None, score)
 
+    def classify_line_cached(self, line: str) -> Tuple[Union[str, None], float]:
+        """
+        带 LRU 缓存的 is_section_header：同一行文本只做一次关键词匹配与向量计算。
+        """
+        with self._header_cache_lock:
+            result = self._header_cache.get(line)
+            if result is not None:
+                self._header_cache.move_to_end(line)
+                return result
+
+        result = self.is_section_header(line)
+
+        if self.header_cache_size > 0:
+            with self._header_cache_lock:
+                self._header_cache[line] = result
+                self._header_cache.move_to_end(line)
+                while len(self._header_cache) > self.header_cache_size:
+                    self._header_cache.popitem(last=False)
+        return result
+
     def detect_sections(
         self,
         lines: List[str],
@@ -58,8 +86,9 @@ class BaseParser(ABC):
         max_unmatched_lines: int = 10,
     ) -> Dict[str, List[str]]:
         tag_heaps: Dict[str, List[Tuple[float, int, str]]] = defaultdict(list)
-        for idx, line in enumerate(lines):
-            tag, score = self.is_section_header(line)
+        # 每行只分类一次，后续截断判断直接复用
+        line_results = [self.classify_line_cached(line) for line in lines]
+        for idx, (tag, score) in enumerate(line_results):
             if tag:
                 heapq.heappush(tag_heaps[tag], (-score, idx))
 
@@ -86,10 +115,8 @@ class BaseParser(ABC):
                 unmatched_count = 0
                 cutoff_idx = len(section_lines)
 
-                for j, line in enumerate(
-                    section_lines[1:], start=1
-                ):  # skip header line
-                    next_tag, next_score = self.is_section_header(line)
+                for j in range(1, len(section_lines)):  # skip header line
+                    next_tag, next_score = line_results[start_idx + j]
                     if not next_tag or next_score < unmatched_score:
                         unmatched_count += 1
                     else:
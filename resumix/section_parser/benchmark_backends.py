@@ -0,0 +1,132 @@
+# section_parser/benchmark_backends.py
+"""
+对比段落分类模型在不同推理后端（torch / onnx / onnx-int8）下的精度与速度。
+
+用法：
+    python -m resumix.section_parser.benchmark_backends --backends torch onnx-int8
+"""
+import argparse
+import statistics
+import time
+from typing import Dict, List
+
+import torch
+from sentence_transformers import util
+
+from resumix.section_parser.jd_section_labels import JDSectionLabels
+from resumix.section_parser.label_embeddings import LabelEmbeddings
+from resumix.section_parser.sample_texts import SAMPLE_JD, SAMPLE_RESUME
+from resumix.section_parser.section_labels import SectionLabels
+from resumix.utils.embedding_registry import EmbeddingRegistry
+
+
+def sample_lines() -> Dict[str, List[str]]:
+    return {
+        "resume": [line.strip() for line in SAMPLE_RESUME.splitlines() if line.strip()],
+        "jd": [line.strip() for line in SAMPLE_JD.splitlines() if line.strip()],
+    }
+
+
+def run_backend(
+    model_name: str, backend: str, samples: Dict[str, List[str]], repeats: int
+) -> dict:
+    model = EmbeddingRegistry.get_model(model_name, backend)
+    model_key = EmbeddingRegistry.model_key(model_name, backend)
+    labels = {
+        "resume": LabelEmbeddings.load(model, model_key, SectionLabels.get_labels()),
+        "jd": LabelEmbeddings.load(
+            model, model_key, JDSectionLabels.get_labels(["zh", "en"])
+        ),
+    }
+    all_lines = samples["resume"] + samples["jd"]
+    model.encode(all_lines[:8])  # 预热
+
+    # 单行延迟
+    latencies = []
+    for line in all_lines:
+        start = time.perf_counter()
+        model.encode(line)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    # 批量吞吐
+    start = time.perf_counter()
+    for _ in range(repeats):
+        model.encode(all_lines, batch_size=64)
+    throughput = len(all_lines) * repeats / (time.perf_counter() - start)
+
+    vectors = {}
+    tags = {}
+    for kind, lines in samples.items():
+        vectors[kind] = model.encode(lines, batch_size=64, convert_to_tensor=True)
+        tags[kind] = labels[kind].best_tags(vectors[kind].float().cpu())
+
+    return {
+        "backend": backend,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": sorted(latencies)[int(len(latencies) * 0.95) - 1],
+        "lines_per_s": throughput,
+        "vectors": vectors,
+        "tags": tags,
+    }
+
+
+def compare(reference: dict, candidate: dict, threshold: float) -> dict:
+    cosines = []
+    tag_agree = header_agree = total = 0
+    for kind, ref_vecs in reference["vectors"].items():
+        cand_vecs = candidate["vectors"][kind].float().cpu()
+        cosines.extend(
+            torch.diagonal(util.cos_sim(ref_vecs.float().cpu(), cand_vecs)).tolist()
+        )
+        for (ref_tag, ref_score), (cand_tag, cand_score) in zip(
+            reference["tags"][kind], candidate["tags"][kind]
+        ):
+            total += 1
+            tag_agree += ref_tag == cand_tag
+            ref_header = ref_tag if ref_score >= threshold else None
+            cand_header = cand_tag if cand_score >= threshold else None
+            header_agree += ref_header == cand_header
+    return {
+        "cos_mean": statistics.mean(cosines),
+        "cos_min": min(cosines),
+        "tag_agreement": tag_agree / total,
+        "header_agreement": header_agree / total,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model", default="paraphrase-multilingual-MiniLM-L12-v2")
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        default=["torch", "onnx-int8"],
+        choices=EmbeddingRegistry.BACKENDS,
+    )
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--threshold", type=float, default=0.65)
+    args = parser.parse_args()
+
+    samples = sample_lines()
+    results = [
+        run_backend(args.model, backend, samples, args.repeats)
+        for backend in args.backends
+    ]
+    reference = results[0]
+
+    print(
+        f"lines: resume={len(samples['resume'])}, jd={len(samples['jd'])}, "
+        f"reference={reference['backend']}"
+    )
+    print(
+        f"{'backend':<10} {'p50 ms':>8} {'p95 ms':>8} {'lines/s':>9} "
+        f"{'cos mean':>9} {'cos min':>8} {'tag agree':>10} {'hdr agree':>10}"
+    )
+    for result in results:
+        diff = compare(reference, result, args.threshold)
+        print(
+            f"{result['backend']:<10} {result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f} "
+            f"{result['lines_per_s']:>9.1f} {diff['cos_mean']:>9.4f} "
+            f"{diff['cos_min']:>8.4f} {diff['tag_agreement']:>10.1%} "
+            f"{diff['header_agreement']:>10.1%}"
+        )
@@ -1,24 +1,103 @@
 import os
 import sys
 import re
+import time
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
 
 
-from typing import Dict, List, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 from resumix.section_parser.jd_section_labels import JDSectionLabels
 from resumix.section_parser.base_parser import BaseParser
 from resumix.utils.url_fetcher import UrlFetcher
 import requests
-import chardet
 from bs4 import BeautifulSoup
 from resumix.utils.llm_client import LLMClient
 import json
 from resumix.utils.logger import logger
 from resumix.section.section_base import SectionBase
+from resumix.config.config import Config
+
+CONFIG = Config().config
+
+
+class SpeculativeJDParse:
+    """
+    一次推测式 JD 解析的句柄：LLM 解析与向量解析同时进行。
+
+    - provisional()：向量解析结果，通常在 LLM 返回前就已可用；
+    - current()：不阻塞，LLM 结果已在截止时间内到达并通过校验则返回之，否则返回向量结果；
+    - result()：最多等到截止时间，返回最终结果；截止时间之后到达的 LLM 结果不再替换。
+    """
+
+    def __init__(self, vector_future: Future, llm_future: Future, deadline: float):
+        self._vector = vector_future
+        self._llm = llm_future
+        self.deadline_at = time.monotonic() + deadline
+        self._llm_finished_at: Optional[float] = None
+        self._llm.add_done_callback(self._on_llm_done)
+
+    def _on_llm_done(self, future: Future):
+        if self._llm_finished_at is None:
+            self._llm_finished_at = time.monotonic()
+        if future.exception() is not None:
+            logger.warning(
+                f"[JDVectorParser] LLM parsing failed, use vector result. "
+                f"Reason: {future.exception()}"
+            )
+
+    def _llm_sections(self) -> Optional[Dict[str, SectionBase]]:
+        if (
+            self._llm_finished_at is None
+            or self._llm_finished_at > self.deadline_at
+            or self._llm.exception() is not None
+        ):
+            return None
+        return self._llm.result()
+
+    def provisional(self) -> Dict[str, SectionBase]:
+        return self._vector.result()
+
+    @property
+    def is_final(self) -> bool:
+        return self._llm_finished_at is not None or time.monotonic() >= self.deadline_at
+
+    def current(self) -> Tuple[Dict[str, SectionBase], str]:
+        llm_sections = self._llm_sections()
+        if llm_sections is not None:
+            return llm_sections, "llm"
+        return self.provisional(), "vector"
+
+    def result(self) -> Tuple[Dict[str, SectionBase], str]:
+        remaining = self.deadline_at - time.monotonic()
+        try:
+            self._llm.result(timeout=max(remaining, 0))
+        except FutureTimeoutError:
+            logger.warning("[JDVectorParser] LLM 解析超过截止时间，使用向量结果")
+        except Exception:
+            pass  # 失败原因已在回调中记录
+        # done 回调可能在 result() 返回后才执行，此处补记完成时间
+        if self._llm.done() and self._llm_finished_at is None:
+            self._llm_finished_at = time.monotonic()
+        return self.current()
 
 
 class JDVectorParser(BaseParser):
+    # LLM 请求在截止时间后仍会跑完（结果写入 LLM 缓存），线程池需留出余量
+    _executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="jd-parse")
+
+    # LLM 结果至少包含其中一个段落才视为有效，否则保留向量解析结果
+    LLM_REQUIRED_SECTIONS = (
+        "responsibilities",
+        "requirements_basic",
+        "requirements_preferred",
+    )
+    # LLMClient 调用失败时返回的文本前缀
+    LLM_ERROR_PREFIX = "❌"
+
     def __init__(
         self, model_name="paraphrase-multilingual-MiniLM-L12-v2", threshold=0.65
     ):
@@ -28,69 +107,112 @@ class JDVectorParser(BaseParser):
 
     def parse(self, jd_text: str) -> Dict[str, SectionBase]:
         """
-        尝试使用 LLM 提取结构化 JD 段落；若失败则回退到向量匹配。
+        并行运行 LLM 结构化解析与向量解析：截止时间内 LLM 结果通过校验则采用之，
+        否则使用向量解析结果。
         返回格式为 Dict[str, SectionBase]，每个字段对应一个段落对象。
         """
-        try:
-            llm_sections = self.parse_with_llm(jd_text)
-            logger.info(f"LLM Sections: {llm_sections}")
+        sections, source = self.parse_speculative(jd_text).result()
+        logger.info(f"[JDVectorParser] Parsed sections with {source}")
+        return sections
 
-            if not isinstance(llm_sections, dict):
-                raise ValueError("LLM返回值不是字典类型")
+    def parse_speculative(
+        self, jd_text: str, deadline: float = None
+    ) -> "SpeculativeJDParse":
+        """
+        同时启动 LLM 解析与向量解析，立即返回句柄。
 
-            if not any(llm_sections.values()):
-                raise ValueError("LLM返回内容为空")
+        参数：
+            jd_text: JD 纯文本
+            deadline: 等待 LLM 结果的最长秒数，默认读取 jd_parser.llm_deadline
 
-            structured_sections = {}
+        返回：
+            SpeculativeJDParse：provisional() 取向量结果，result() 取最终结果。
+        """
+        if deadline is None:
+            deadline = getattr(getattr(CONFIG, "JD_PARSER", None), "LLM_DEADLINE", 20)
+        llm_future = self._executor.submit(self.parse_sections_with_llm, jd_text)
+        vector_future = self._executor.submit(self.parse_with_vector, jd_text)
+        return SpeculativeJDParse(vector_future, llm_future, deadline)
 
-            for tag, content in llm_sections.items():
-                try:
-                    # 合并嵌套结构为纯文本
-                    if isinstance(content, dict):
-                        lines = [
-                            f"{k}: {v}"
-                            for k, v in content.items()
-                            if isinstance(v, str) and v.strip()
-                        ]
-                        text = "\n".join(lines)
-                    elif isinstance(content, str):
-                        text = content.strip()
-                    else:
-                        raise TypeError(f"段落 {tag} 类型非法：{type(content)}")
-
-                    if not text:
-                        raise ValueError(f"段落 {tag} 内容为空")
-
-                    line_list = self.normalize_text(text, keep_blank=True)
-                    raw_text = "\n".join(line_list)
-                    tag_key = tag.lower().replace(" ", "_")
-
-                    cls = SectionBase
-                    section_obj = cls(tag_key, raw_text)
-                    section_obj.original_lines = line_list
-                    section_obj.parsed_data = {"raw": raw_text}
-
-                    structured_sections[tag_key] = section_obj
-                except Exception as e_section:
-                    logger.warning(
-                        f"[JDVectorParser] 段落处理失败: {tag} - {e_section}"
-                    )
-
-            if structured_sections:
-                logger.info("[JDVectorParser] Parsed sections with LLM")
-                return structured_sections
-            else:
-                raise ValueError("所有段落处理失败，无有效结构")
+    def parse_sections_with_llm(self, jd_text: str) -> Dict[str, SectionBase]:
+        """
+        使用 LLM 提取结构化 JD 段落，结果无效时抛出异常。
+        """
+        llm_sections = self.parse_with_llm(jd_text)
+        logger.info(f"LLM Sections: {llm_sections}")
+
+        if not isinstance(llm_sections, dict):
+            raise ValueError("LLM返回值不是字典类型")
+
+        if not any(llm_sections.values()):
+            raise ValueError("LLM返回内容为空")
+
+        raw_text = llm_sections.get("RawText")
+        if isinstance(raw_text, str) and raw_text.strip().startswith(
+            self.LLM_ERROR_PREFIX
+        ):
+            raise ValueError(f"LLM调用失败: {raw_text.strip()[:200]}")
+
+        structured_sections = {}
+
+        for tag, content in llm_sections.items():
+            try:
+                # 合并嵌套结构为纯文本
+                if isinstance(content, dict):
+                    lines = [
+                        f"{k}: {v}"
+                        for k, v in content.items()
+                        if isinstance(v, str) and v.strip()
+                    ]
+                    text = "\n".join(lines)
+                elif isinstance(content, str):
+                    text = content.strip()
+                else:
+                    raise TypeError(f"段落 {tag} 类型非法：{type(content)}")
+
+                if not text:
+                    raise ValueError(f"段落 {tag} 内容为空")
+
+                line_list = self.normalize_text(text, keep_blank=True)
+                raw_text = "\n".join(line_list)
+                tag_key = tag.lower().replace(" ", "_")
 
-        except Exception as e:
-            import traceback
+                cls = SectionBase
+                section_obj = cls(tag_key, raw_text)
+                section_obj.original_lines = line_list
+                section_obj.parsed_data = {"raw": raw_text}
 
-            logger.warning(
-                f"[JDVectorParser] LLM parsing failed, fallback to vector. Reason: {e}"
-            )
-            logger.debug(traceback.format_exc())
+                structured_sections[tag_key] = section_obj
+            except Exception as e_section:
+                logger.warning(f"[JDVectorParser] 段落处理失败: {tag} - {e_section}")
 
-        # fallback：向量结构解析
+        if not structured_sections:
+            raise ValueError("所有段落处理失败，无有效结构")
+        if not self.is_valid_llm_sections(structured_sections):
+            raise ValueError(f"LLM结果缺少有效段落: {list(structured_sections.keys())}")
+        return structured_sections
+
+    @classmethod
+    def is_valid_llm_sections(cls, sections: Dict[str, SectionBase]) -> bool:
+        """
+        校验 LLM 解析结果：需包含 LLM_REQUIRED_SECTIONS 中至少一个非空段落，
+        且任一段落都不是 LLM 调用失败的错误信息。
+        """
+        if not isinstance(sections, dict):
+            return False
+        for section in sections.values():
+            raw_text = getattr(section, "raw_text", "") or ""
+            if raw_text.strip().startswith(cls.LLM_ERROR_PREFIX):
+                return False
+        return any(
+            (getattr(sections.get(name), "raw_text", "") or "").strip()
+            for name in cls.LLM_REQUIRED_SECTIONS
+        )
+
+    def parse_with_vector(self, jd_text: str) -> Dict[str, SectionBase]:
+        """
+        向量结构解析，不依赖 LLM。
+        """
         try:
             line_list = self.normalize_text(jd_text, keep_blank=True)
             section_lines = self.detect_sections(line_list)
@@ -102,40 +224,22 @@ class JDVectorParser(BaseParser):
                 section_obj = cls(section, raw_text)
                 section_obj.original_lines = lines
                 section_obj.parsed_data = {"raw": raw_text}
-                section_obj.parse()
 
-                logger.info(f"[JDVectorParser] Fallback section '{section}'")
+                logger.info(f"[JDVectorParser] Vector section '{section}'")
                 structured_sections[section] = section_obj
 
-            logger.info("[JDVectorParser] Parsed sections with vector fallback")
             return structured_sections
         except Exception as e:
-            logger.error(f"[JDVectorParser] fallback 向量解析也失败: {e}")
+            logger.error(f"[JDVectorParser] 向量解析失败: {e}")
             logger.debug(traceback.format_exc())
             return {"overview": SectionBase("overview", "❌ 无法解析 JD 内容。")}
 
     def fetch_text_from_url(self, url: str) -> str:
         logger.info(f"[JD Fetcher] 开始抓取 URL: {url}")
 
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/115.0.0.0 Safari/537.36"
-            )
-        }
-
         try:
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            logger.info(f"[JD Fetcher] HTTP 状态码: {response.status_code}")
-
-            # 自动检测网页编码
-            detected = chardet.detect(response.content)
-            encoding = detected["encoding"] or "utf-8"
-            logger.info(f"[JD Fetcher] 检测到网页编码: {encoding}")
-
-            html = response.content.decode(encoding, errors="replace")
+            result = UrlFetcher.get(url, timeout=10)
+            html = UrlFetcher.decode_html(result["content"], result["content_type"])
             soup = BeautifulSoup(html, "html.parser")
 
             # 清除非正文区域
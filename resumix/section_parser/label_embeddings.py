@@ -0,0 +1,140 @@
+# section_parser/label_embeddings.py
+import hashlib
+import json
+import os
+from typing import Dict, List
+
+import numpy as np
+import torch
+from sentence_transformers import util
+
+from resumix.config.config import Config
+from resumix.utils.logger import logger
+
+CONFIG = Config().config
+
+
+class LabelEmbeddings:
+    """
+    段落标签的向量矩阵。
+
+    - matrix: 所有标签向量按行堆叠并 L2 归一化后的矩阵（labels × dim）；
+    - tag_index: 每一行所属 tag 在 tags 中的下标；
+    - 以 (模型名, 标签列表) 的哈希为键持久化到磁盘，启动时以内存映射方式加载，
+      标签或模型变化时才重新 encode。
+    """
+
+    def __init__(self, matrix: torch.Tensor, tag_index: torch.Tensor, tags: List[str]):
+        self.matrix = matrix
+        self.tag_index = tag_index
+        self.tags = tags
+
+    @staticmethod
+    def labels_hash(model_name: str, section_labels: Dict[str, List[str]]) -> str:
+        raw = json.dumps(
+            {
+                "model": model_name,
+                "labels": {
+                    tag: sorted(labels) for tag, labels in section_labels.items()
+                },
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+    @classmethod
+    def load(
+        cls,
+        model,
+        model_name: str,
+        section_labels: Dict[str, List[str]],
+        cache_dir: str = None,
+    ) -> "LabelEmbeddings":
+        """
+        读取（或计算并保存）标签向量矩阵。
+
+        参数：
+            model: 已加载的 SentenceTransformer
+            model_name: 模型名称，参与缓存键计算
+            section_labels: {tag: [label, ...]}
+            cache_dir: 缓存目录，默认读取 embedding.label_cache_dir
+
+        返回：
+            LabelEmbeddings 实例。
+        """
+        cache_dir = cache_dir or getattr(
+            getattr(CONFIG, "EMBEDDING", None),
+            "LABEL_CACHE_DIR",
+            "resumix/cache/label_embeddings",
+        )
+        key = cls.labels_hash(model_name, section_labels)
+        matrix_path = os.path.join(cache_dir, f"{key}.npy")
+        meta_path = os.path.join(cache_dir, f"{key}.json")
+
+        if os.path.exists(matrix_path) and os.path.exists(meta_path):
+            try:
+                # copy-on-write 内存映射：按需读页，且可直接交给 torch 使用
+                matrix = np.load(matrix_path, mmap_mode="c")
+                with open(meta_path, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+                logger.info(f"[LabelEmbeddings] 从缓存加载标签向量: {matrix_path}")
+                return cls(
+                    torch.from_numpy(matrix),
+                    torch.tensor(meta["tag_index"], dtype=torch.long),
+                    meta["tags"],
+                )
+            except Exception as e:
+                logger.warning(f"[LabelEmbeddings] 读取缓存失败，重新计算: {e}")
+
+        tags = list(section_labels.keys())
+        labels = [label for tag in tags for label in section_labels[tag]]
+        tag_index = [i for i, tag in enumerate(tags) for _ in section_labels[tag]]
+
+        matrix = model.encode(
+            labels, convert_to_numpy=True, normalize_embeddings=True
+        ).astype(np.float32)
+
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f"{matrix_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, matrix)
+            os.replace(tmp_path, matrix_path)
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"model": model_name, "tags": tags, "tag_index": tag_index}, f
+                )
+            logger.info(f"[LabelEmbeddings] 标签向量已保存: {matrix_path}")
+        except OSError as e:
+            logger.warning(f"[LabelEmbeddings] 保存标签向量失败: {e}")
+
+        return cls(
+            torch.from_numpy(matrix), torch.tensor(tag_index, dtype=torch.long), tags
+        )
+
+    def tag_scores(self, line_vecs: torch.Tensor) -> torch.Tensor:
+        """
+        计算 lines × tags 的相似度矩阵：先与全部标签向量求一次余弦相似度，
+        再按 tag 分组取最大值。
+        """
+        line_vecs = torch.as_tensor(line_vecs)
+        sims = util.cos_sim(line_vecs, self.matrix.to(line_vecs.device))
+        index = self.tag_index.to(sims.device).unsqueeze(0).expand_as(sims)
+        scores = torch.full(
+            (sims.shape[0], len(self.tags)),
+            float("-inf"),
+            dtype=sims.dtype,
+            device=sims.device,
+        )
+        return scores.scatter_reduce(1, index, sims, reduce="amax")
+
+    def best_tags(self, line_vecs: torch.Tensor):
+        """
+        返回每一行最相似的 (tag, score) 列表。
+        """
+        best_scores, best_idxs = self.tag_scores(line_vecs).max(dim=1)
+        return [
+            (self.tags[tag_idx], score)
+            for score, tag_idx in zip(best_scores.tolist(), best_idxs.tolist())
+        ]
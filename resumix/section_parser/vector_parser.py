@@ -1,13 +1,15 @@
 from typing import Dict, List, Tuple, Union
-from sentence_transformers import SentenceTransformer, util
 import os
 import sys
 import heapq
 from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor
 from resumix.utils.logger import logger
+from resumix.utils.embedding_registry import EmbeddingRegistry
+from resumix.utils.embedding_cache import LineEmbeddingCache
 
 from resumix.section_parser.section_labels import SectionLabels
+from resumix.section_parser.label_embeddings import LabelEmbeddings
+from resumix.section_parser.keyword_matcher import KeywordMatcher
 
 from resumix.section.education_section import EducationSection
 from resumix.section.experience_section import ExperienceSection
@@ -32,15 +34,22 @@ SECTION_LABELS = SectionLabels.get_labels()
 
 class VectorParser:
     def __init__(
-        self, model_name="paraphrase-multilingual-MiniLM-L12-v2", threshold=0.65
+        self,
+        model_name="paraphrase-multilingual-MiniLM-L12-v2",
+        threshold=0.65,
+        batch_size=64,
     ):
-        self.model = SentenceTransformer(model_name)
+        self.model = EmbeddingRegistry.get_model(model_name)
+        model_key = EmbeddingRegistry.model_key(model_name)
         self.threshold = threshold
-        # 这里可以改为持久化设置
-        self.LABEL_EMBEDDINGS = {
-            tag: self.model.encode(labels, convert_to_tensor=True)
-            for tag, labels in SECTION_LABELS.items()
-        }
+        self.batch_size = batch_size
+        # 标签向量矩阵持久化在磁盘，标签或模型变化时才重新计算
+        self.label_embeddings = LabelEmbeddings.load(
+            self.model, model_key, SECTION_LABELS
+        )
+        self.keyword_matcher = KeywordMatcher(SECTION_LABELS)
+        # 跨请求的行向量缓存，重复出现的行不再经过模型
+        self.line_cache = LineEmbeddingCache.for_model(self.model, model_key)
 
     def normalize_text(self, text: str, keep_blank: bool = False) -> List[str]:
         lines = text.splitlines()
@@ -50,27 +59,63 @@ class VectorParser:
             if keep_blank or line.strip()
         ]
 
+    def encode_lines(self, lines: List[str]):
+        if self.line_cache is not None:
+            return self.line_cache.encode(lines)
+        return self.model.encode(
+            lines, batch_size=self.batch_size, convert_to_tensor=True
+        )
+
     def vector_classify_line(self, line: str) -> Tuple[Union[str, None], float]:
         if not line.strip():
             return None, 0.0
-        line_vec = self.model.encode(line, convert_to_tensor=True)
-        best_tag = None
-        best_score = -1
-        for tag, tag_vecs in self.LABEL_EMBEDDINGS.items():
-            # 计算行向量与标签向量的相似度，提取最大值
-            score = util.cos_sim(line_vec, tag_vecs).max().item()
-            if score > best_score:
-                best_score = score
-                best_tag = tag
-        return best_tag, best_score
+        line_vec = self.encode_lines([line])
+        # 计算行向量与标签向量的相似度，提取最大值
+        return self.label_embeddings.best_tags(line_vec)[0]
+
+    def keyword_match(self, line: str) -> Union[str, None]:
+        found = self.keyword_matcher.find(line)
+        if found is None:
+            return None
+        tag, kw = found
+        logger.info(f"Keyword match: '{kw}' in line: '{line}'")
+        return tag
+
+    def classify_lines(self, lines: List[str]) -> List[Tuple[Union[str, None], float]]:
+        """
+        批量版 is_section_header：关键词未命中的非空行一次性 encode，
+        与标签矩阵做一次矩阵相似度计算，结果与逐行调用一致。
+        """
+        results: List[Tuple[Union[str, None], float]] = [(None, 0.0)] * len(lines)
+        pending: List[int] = []
+        for idx, line in enumerate(lines):
+            tag = self.keyword_match(line)
+            if tag is not None:
+                results[idx] = (tag, 1.0)
+            elif line.strip():
+                pending.append(idx)
+
+        if not pending:
+            return results
+
+        line_vecs = self.encode_lines([lines[idx] for idx in pending])
+        for idx, (tag, score) in zip(
+            pending, self.label_embeddings.best_tags(line_vecs)
+        ):
+            if score >= self.threshold:
+                logger.info(
+                    f"Vector match: '{tag}' with score {score:.2f} for line: '{lines[idx]}'"
+                )
+                results[idx] = (tag, score)
+            else:
+                results[idx] = (None, score)
+        return results
 
     def is_section_header(self, line: str) -> Tuple[Union[str, None], float]:
         # 1. 关键词匹配优先
-        for tag, keywords in SECTION_LABELS.items():
-            for kw in keywords:
-                if kw.lower() in line.lower():
-                    logger.info(f"Keyword match: '{kw}' in line: '{line}'")
-                    return (tag, 1.0)  # 明确命中关键词，打满分
+        tag = self.keyword_match(line)
+        if tag is not None:
+            return (tag, 1.0)  # 明确命中关键词，打满分
 
         # 2. fallback 使用向量匹配
         tag, score = self.vector_classify_line(line)
@@ -84,26 +129,12 @@ class VectorParser:
 
     @timeit()
     def detect_headers(self, lines: List[str]):
-        logger.debug("开始并行识别 Section Header...")
+        logger.debug("开始批量识别 Section Header...")
 
         tag_heaps: Dict[str, List[Tuple[float, int, str]]] = defaultdict(list)
-        with ThreadPoolExecutor(max_workers=8) as execcutor:
-            future_to_idx = {
-                execcutor.submit(self.is_section_header, line): idx
-                for idx, line in enumerate(lines)
-            }
-
-            for future in future_to_idx:
-                idx = future_to_idx[future]
-                try:
-                    tag, score = future.result()
-                    if tag is not None:
-                        heapq.heappush(tag_heaps[tag], (-score, idx))
-
-                except Exception as e:
-                    logger.warning(
-                        f"[detect_sections] Line {idx} header detection failed: {e}"
-                    )
+        for idx, (tag, score) in enumerate(self.classify_lines(lines)):
+            if tag is not None:
+                heapq.heappush(tag_heaps[tag], (-score, idx))
 
         return tag_heaps
 
@@ -179,56 +210,9 @@ class VectorParser:
 
 
 if __name__ == "__main__":
-    sample_text = """
-    
-    张三
-    电话: 13800001111
-    邮箱: zhangsan@example.com
-    地址: 北京市海淀区中关村大街27号
-    GitHub: github.com/zhangsan
-    LinkedIn: linkedin.com/in/zhangsan
-    
-    
-    技能特长
-    编程语言：Python, Go, Java, C++
-    后端技术：Django, FastAPI, Redis, Kafka, MySQL, MongoDB
-    工具与平台：Docker, Kubernetes, Git, Linux
-    AI & NLP：Transformers, PaddleOCR, sentence-transformers
-    语言能力：英语（CET-6 530），普通话（二甲）
-
-    教育背景
-    2015.09 - 2019.06 清华大学 软件工程 本科
-    - GPA：3.8/4.0（专业前10%）
-    - 主修课程：操作系统、计算机网络、人工智能、软件工程、数据库系统
-
-
-    项目经历
-    2023.01 - 2023.04 智能简历解析平台（个人项目）
-    - 技术栈：Python, PaddleOCR, FastAPI, Sentence-BERT
-    - 设计一套支持中英文简历识别的端到端平台，准确提取教育、项目、技能等结构化信息
-    - 使用嵌入向量和聚类算法，提升 section 匹配准确率至92%
-
-    2022.06 - 2022.08 企业内推系统（校内合作项目）
-    - 使用 Django + Vue 实现一套简历内推与岗位推荐平台
-    - 集成 Elasticsearch 实现关键词匹配与倒排索引，实现岗位相似度排序
-
-    证书与奖项
-    - 2022 年中国软件杯二等奖
-    - 国家奖学金（2017-2018学年）
-    - 腾讯犀牛鸟精英实习生认证
-
-    工作经历
-    2021.07 - 至今  字节跳动（北京）  
-    后端研发工程师｜推荐系统平台组
-    - 负责用户画像服务模块的优化，提升接口响应速度30%
-    - 基于Redis + Flink 实现行为日志的实时聚合服务，服务日均处理10亿条记录
-    - 推动服务容器化上线，撰写 CI/CD 脚本并部署至Kubernetes集群
-
-    2020.07 - 2021.06  腾讯实习生  
-    实习岗位：后台开发实习生（云服务部门）
-    - 参与搭建内部配置平台，支持10+项目的配置热更新
-    - 使用Go开发配置管理服务，结合Etcd实现高可用分布式存储
-"""
+    from resumix.section_parser.sample_texts import SAMPLE_RESUME
+
+    sample_text = SAMPLE_RESUME
 
     parser = VectorParser()
     structured = parser.parse_resume(sample_text)
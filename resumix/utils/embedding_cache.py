@@ -0,0 +1,255 @@
+# utils/embedding_cache.py
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+import torch
+
+from resumix.config.config import Config
+from resumix.utils.logger import logger
+from resumix.utils.sqlite_store import SQLiteStore
+
+CONFIG = Config().config
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+class _LineEmbeddingStore(SQLiteStore):
+    """LineEmbeddingCache 的磁盘层，多个模型共用同一张表"""
+
+    TABLE = "line_embeddings"
+    KEY_COLUMNS = ("model", "key")
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS line_embeddings (
+            model TEXT NOT NULL,
+            key TEXT NOT NULL,
+            vector BLOB NOT NULL,
+            size INTEGER NOT NULL,
+            accessed_at REAL NOT NULL,
+            PRIMARY KEY (model, key)
+        )
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        self._open(path, max_bytes)
+
+    def _migrate(self):
+        columns = {
+            row[1] for row in self._conn.execute("PRAGMA table_info(line_embeddings)")
+        }
+        if columns and "accessed_at" not in columns:
+            # 旧版本无淘汰字段，直接重建（缓存可丢弃）
+            self._conn.execute("DROP TABLE line_embeddings")
+
+    def get_many(self, model: str, keys: List[str]) -> Dict[str, np.ndarray]:
+        found = {}
+        with self._db_lock:
+            # SQLite 单条语句的参数个数有限，分块查询
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM line_embeddings "
+                    f"WHERE model = ? AND key IN ({','.join('?' * len(chunk))})",
+                    (model, *chunk),
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float16)
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE line_embeddings SET accessed_at = ? WHERE model = ? AND key = ?",
+                    [(now, model, key) for key in found],
+                )
+                self._conn.commit()
+        return found
+
+    def put_many(self, model: str, items: Dict[str, np.ndarray]):
+        now = time.time()
+        with self._db_lock:
+            self._upsert_many(
+                [
+                    {
+                        "model": model,
+                        "key": key,
+                        "vector": vector.tobytes(),
+                        "size": vector.nbytes,
+                        "accessed_at": now,
+                    }
+                    for key, vector in items.items()
+                ]
+            )
+            self._evict()
+            self._conn.commit()
+
+
+class LineEmbeddingCache:
+    """
+    文本行 → 句向量的跨请求缓存。
+
+    - 键：NFKC 归一化并压缩空白后的行文本；
+    - 内存层：按字节数上限的 LRU，向量以 float16 存储；
+    - 磁盘层（可选，默认关闭）：SQLite，进程重启后仍可命中，按字节数上限做 LRU 淘汰；
+    - 未命中时对键首次出现时的原始行 encode；归一化后相同的行（全角 / 半角、
+      空白差异）共用这一个向量；
+    - 因此缓存结果与直接 encode 并不逐位相同（float16 舍入、变体共用向量），
+      只保证段落分类结果一致；
+    - 每个模型一个实例，记录内存 / 磁盘命中与未命中次数。
+    """
+
+    _caches: Dict[str, "LineEmbeddingCache"] = {}
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        model,
+        model_name: str,
+        max_bytes: int = 32 * 1024 * 1024,
+        disk_path: Optional[str] = None,
+        batch_size: int = 64,
+        disk_max_bytes: int = 64 * 1024 * 1024,
+    ):
+        """
+        参数：
+            model: 已加载的 SentenceTransformer
+            model_name: 模型名称，用于区分磁盘缓存中的不同模型
+            max_bytes: 内存层向量总字节数上限
+            disk_path: 磁盘层 SQLite 文件路径，为 None 时仅使用内存层
+            batch_size: 未命中行批量 encode 时的批大小
+            disk_max_bytes: 磁盘层向量总字节数上限
+        """
+        self.model = model
+        self.model_name = model_name
+        self.max_bytes = max_bytes
+        self.batch_size = batch_size
+        self.disk_max_bytes = disk_max_bytes
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._bytes = 0
+        self._mem_lock = threading.Lock()
+        self._disk = (
+            _LineEmbeddingStore(disk_path, disk_max_bytes) if disk_path else None
+        )
+
+    @classmethod
+    def for_model(cls, model, model_name: str) -> Optional["LineEmbeddingCache"]:
+        """
+        获取指定模型共享的缓存实例，配置 embedding.line_cache 未启用时返回 None。
+        """
+        cache_config = getattr(getattr(CONFIG, "EMBEDDING", None), "LINE_CACHE", None)
+        if cache_config is None or not getattr(cache_config, "ENABLED", False):
+            return None
+
+        with cls._lock:
+            if model_name not in cls._caches:
+                cls._caches[model_name] = cls(
+                    model,
+                    model_name,
+                    max_bytes=getattr(cache_config, "MAX_BYTES", 32 * 1024 * 1024),
+                    disk_path=getattr(cache_config, "DISK_PATH", None),
+                    batch_size=getattr(CONFIG.EMBEDDING, "BATCH_SIZE", 64),
+                    disk_max_bytes=getattr(
+                        cache_config, "DISK_MAX_BYTES", 64 * 1024 * 1024
+                    ),
+                )
+                logger.info(f"[LineEmbeddingCache] 行向量缓存已启用: {model_name}")
+            return cls._caches[model_name]
+
+    @staticmethod
+    def normalize(line: str) -> str:
+        return _WHITESPACE_PATTERN.sub(" ", unicodedata.normalize("NFKC", line)).strip()
+
+    def _memory_put(self, key: str, vector: np.ndarray):
+        with self._mem_lock:
+            old = self._memory.pop(key, None)
+            if old is not None:
+                self._bytes -= old.nbytes
+            self._memory[key] = vector
+            self._bytes += vector.nbytes
+            while self._bytes > self.max_bytes and self._memory:
+                _, evicted = self._memory.popitem(last=False)
+                self._bytes -= evicted.nbytes
+
+    def _disk_get(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        if self._disk is None or not keys:
+            return {}
+        return self._disk.get_many(self.model_name, keys)
+
+    def _disk_put(self, items: Dict[str, np.ndarray]):
+        if self._disk is None or not items:
+            return
+        self._disk.put_many(self.model_name, items)
+
+    def encode(self, lines: List[str]) -> torch.Tensor:
+        """
+        获取多行文本的向量，未命中的行批量 encode 后写回缓存。
+
+        参数：
+            lines: 文本行列表
+
+        返回：
+            float32 的 torch.Tensor，形状为 (len(lines), dim)。
+        """
+        if not lines:
+            return torch.empty((0, 0))
+        keys = [self.normalize(line) for line in lines]
+        # 同一键首次出现的原始行，未命中时用它 encode
+        originals: Dict[str, str] = {}
+        for key, line in zip(keys, lines):
+            originals.setdefault(key, line)
+        vectors: Dict[str, np.ndarray] = {}
+
+        with self._mem_lock:
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    vectors[key] = vector
+        memory_hits = sum(1 for key in keys if key in vectors)
+
+        missing = list(dict.fromkeys(k for k in keys if k not in vectors))
+        for key, vector in self._disk_get(missing).items():
+            vectors[key] = vector
+            self._memory_put(key, vector)
+        disk_hits = sum(1 for key in keys if key in vectors) - memory_hits
+
+        missing = [key for key in missing if key not in vectors]
+        with self._mem_lock:
+            self.hits += memory_hits
+            self.disk_hits += disk_hits
+            self.misses += len(keys) - memory_hits - disk_hits
+
+        if missing:
+            encoded = self.model.encode(
+                [originals[key] for key in missing],
+                batch_size=self.batch_size,
+                convert_to_numpy=True,
+            ).astype(np.float16)
+            # 逐行复制，避免缓存项引用整块 encode 结果导致字节统计失真
+            new_items = {key: row.copy() for key, row in zip(missing, encoded)}
+            for key, vector in new_items.items():
+                vectors[key] = vector
+                self._memory_put(key, vector)
+            self._disk_put(new_items)
+
+        return torch.from_numpy(np.stack([vectors[key] for key in keys])).float()
+
+    def encode_one(self, line: str) -> torch.Tensor:
+        return self.encode([line])[0]
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "model": self.model_name,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            "entries": len(self._memory),
+            "bytes": self._bytes,
+        }
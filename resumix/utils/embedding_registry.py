@@ -0,0 +1,144 @@
+# utils/embedding_registry.py
+import glob
+import os
+import threading
+import time
+from typing import Dict, List, Tuple, Union
+
+from sentence_transformers import SentenceTransformer
+
+from resumix.config.config import Config
+from resumix.utils.logger import logger
+
+CONFIG = Config().config
+
+
+class EmbeddingRegistry:
+    """
+    进程级句向量模型注册表。
+
+    - 每个模型名在进程内只加载一次，解析器 / 关键词模块 / KeyBERT 共享同一实例；
+    - 按模型名加锁，并发首次访问时不会重复加载权重；
+    - embed() 统一批量编码入口，批大小默认读取 embedding.batch_size；
+    - 推理后端由 embedding.backend 决定："torch"（默认）、"onnx"，
+      或 "onnx-int8"（导出 ONNX 并做 int8 动态量化，仅在 CPU 上有收益）。
+    """
+
+    BACKENDS = ("torch", "onnx", "onnx-int8")
+
+    _models: Dict[Tuple[str, str], SentenceTransformer] = {}
+    _model_locks: Dict[Tuple[str, str], threading.Lock] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def default_backend() -> str:
+        return getattr(getattr(CONFIG, "EMBEDDING", None), "BACKEND", "torch")
+
+    @classmethod
+    def model_key(cls, model_name: str, backend: str = None) -> str:
+        """
+        模型在缓存中的标识：不同后端产出的向量不完全一致，
+        标签向量 / 行向量缓存需按后端区分。
+        """
+        backend = backend or cls.default_backend()
+        return model_name if backend == "torch" else f"{model_name}@{backend}"
+
+    @classmethod
+    def get_model(cls, model_name: str, backend: str = None) -> SentenceTransformer:
+        """
+        获取（或加载）指定名称的 SentenceTransformer。
+
+        参数：
+            model_name: 模型名称或本地路径
+            backend: 推理后端，默认读取 embedding.backend
+
+        返回：
+            共享的 SentenceTransformer 实例。
+        """
+        backend = backend or cls.default_backend()
+        if backend not in cls.BACKENDS:
+            raise ValueError(f"不支持的向量模型后端：{backend}")
+
+        key = (model_name, backend)
+        model = cls._models.get(key)
+        if model is not None:
+            return model
+
+        with cls._lock:
+            model_lock = cls._model_locks.setdefault(key, threading.Lock())
+
+        # 只锁当前模型，加载期间不阻塞其他模型的获取
+        with model_lock:
+            if key not in cls._models:
+                start = time.time()
+                cls._models[key] = cls._load(model_name, backend)
+                logger.info(
+                    f"[EmbeddingRegistry] 加载模型 '{model_name}' ({backend})，"
+                    f"耗时 {time.time() - start:.2f}s"
+                )
+            return cls._models[key]
+
+    @classmethod
+    def _load(cls, model_name: str, backend: str) -> SentenceTransformer:
+        if backend == "torch":
+            return SentenceTransformer(model_name)
+        if backend == "onnx":
+            return SentenceTransformer(model_name, backend="onnx")
+        return cls._load_quantized(model_name)
+
+    @staticmethod
+    def _load_quantized(model_name: str) -> SentenceTransformer:
+        """
+        加载 int8 动态量化的 ONNX 模型；本地不存在时先导出并量化，之后直接复用。
+        """
+        from sentence_transformers.backend import export_dynamic_quantized_onnx_model
+
+        embedding_config = getattr(CONFIG, "EMBEDDING", None)
+        onnx_dir = getattr(embedding_config, "ONNX_DIR", "resumix/cache/onnx")
+        quantization = getattr(embedding_config, "QUANTIZATION", "avx512_vnni")
+        save_dir = os.path.join(onnx_dir, model_name.replace("/", "__"))
+        pattern = os.path.join(save_dir, "onnx", f"model_*_{quantization}.onnx")
+
+        if not glob.glob(pattern):
+            logger.info(
+                f"[EmbeddingRegistry] 导出 int8 量化 ONNX 模型 '{model_name}' "
+                f"({quantization}) -> {save_dir}"
+            )
+            onnx_model = SentenceTransformer(model_name, backend="onnx")
+            onnx_model.save_pretrained(save_dir)
+            export_dynamic_quantized_onnx_model(onnx_model, quantization, save_dir)
+
+        file_name = os.path.relpath(sorted(glob.glob(pattern))[0], save_dir)
+        return SentenceTransformer(
+            save_dir, backend="onnx", model_kwargs={"file_name": file_name}
+        )
+
+    @classmethod
+    def embed(
+        cls,
+        texts: Union[str, List[str]],
+        model_name: str = "paraphrase-multilingual-MiniLM-L12-v2",
+        batch_size: int = None,
+        **kwargs,
+    ):
+        """
+        批量编码文本。
+
+        参数：
+            texts: 单条文本或文本列表
+            model_name: 模型名称
+            batch_size: 批大小，默认读取 embedding.batch_size
+            kwargs: 透传给 SentenceTransformer.encode（如 convert_to_tensor）
+
+        返回：
+            与 SentenceTransformer.encode 相同的向量结果。
+        """
+        batch_size = batch_size or getattr(
+            getattr(CONFIG, "EMBEDDING", None), "BATCH_SIZE", 64
+        )
+        return cls.get_model(model_name).encode(texts, batch_size=batch_size, **kwargs)
+
+    @classmethod
+    def loaded(cls) -> List[str]:
+        """返回已加载的模型列表"""
+        return [cls.model_key(name, backend) for name, backend in cls._models]
@@ -0,0 +1,148 @@
+# utils/http_cache.py
+import re
+import time
+from typing import Optional
+
+from resumix.config.config import Config
+from resumix.utils.logger import logger
+from resumix.utils.sqlite_store import SingletonSQLiteStore
+
+CONFIG = Config().config
+
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+class HttpCache(SingletonSQLiteStore):
+    """
+    UrlFetcher 使用的磁盘 HTTP 缓存（SQLite）。
+
+    - 以 URL 为键保存解压后的响应体及 ETag / Last-Modified / Content-Type；
+    - Cache-Control: max-age 内直接复用，过期后由调用方发送条件请求重新验证；
+    - no-store 的响应不缓存；按总字节数做 LRU 淘汰。
+    """
+
+    TABLE = "http_cache"
+    KEY_COLUMNS = ("url",)
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS http_cache (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            content_type TEXT,
+            content BLOB NOT NULL,
+            size INTEGER NOT NULL,
+            expires_at REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        )
+    """
+
+    def __init__(
+        self,
+        path: str = "resumix/cache/http_cache.db",
+        max_bytes: int = 200 * 1024 * 1024,
+    ):
+        """
+        参数：
+            path: SQLite 数据库文件路径
+            max_bytes: 缓存响应体总字节数上限
+        """
+        if self._initialized:
+            return
+        self._open(path, max_bytes)
+        self._initialized = True
+        logger.info(f"[HttpCache] 缓存已启用: {path}")
+
+    @classmethod
+    def from_config(cls) -> Optional["HttpCache"]:
+        """根据 config.yaml 中的 url_fetcher.cache 配置创建缓存，未启用时返回 None"""
+        cache_config = getattr(getattr(CONFIG, "URL_FETCHER", None), "CACHE", None)
+        if cache_config is None or not getattr(cache_config, "ENABLED", False):
+            return None
+        return cls(
+            path=getattr(cache_config, "PATH", "resumix/cache/http_cache.db"),
+            max_bytes=getattr(cache_config, "MAX_BYTES", 200 * 1024 * 1024),
+        )
+
+    @staticmethod
+    def max_age(headers) -> Optional[int]:
+        """解析 Cache-Control；no-store 返回 None，表示不可缓存"""
+        cache_control = headers.get("Cache-Control", "").lower()
+        if "no-store" in cache_control:
+            return None
+        if "no-cache" in cache_control:
+            return 0
+        match = _MAX_AGE_PATTERN.search(cache_control)
+        return int(match.group(1)) if match else 0
+
+    def get(self, url: str) -> Optional[dict]:
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, content_type, content, expires_at "
+                "FROM http_cache WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE http_cache SET accessed_at = ? WHERE url = ?",
+                (time.time(), url),
+            )
+            self._conn.commit()
+
+        etag, last_modified, content_type, content, expires_at = row
+        return {
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_type": content_type,
+            "content": bytes(content),
+            "fresh": time.time() < expires_at,
+        }
+
+    def set(self, url: str, headers, content: bytes):
+        max_age = self.max_age(headers)
+        if max_age is None:
+            return
+        now = time.time()
+        with self._db_lock:
+            self._upsert_many(
+                [
+                    {
+                        "url": url,
+                        "etag": headers.get("ETag"),
+                        "last_modified": headers.get("Last-Modified"),
+                        "content_type": headers.get("Content-Type"),
+                        "content": content,
+                        "size": len(content),
+                        "expires_at": now + max_age,
+                        "accessed_at": now,
+                    }
+                ]
+            )
+            self._evict()
+            self._conn.commit()
+
+    def refresh(self, url: str, headers):
+        """304 响应后更新有效期与验证字段"""
+        max_age = self.max_age(headers) or 0
+        with self._db_lock:
+            self._conn.execute(
+                """
+                UPDATE http_cache
+                SET expires_at = ?,
+                    etag = COALESCE(?, etag),
+                    last_modified = COALESCE(?, last_modified)
+                WHERE url = ?
+                """,
+                (
+                    time.time() + max_age,
+                    headers.get("ETag"),
+                    headers.get("Last-Modified"),
+                    url,
+                ),
+            )
+            self._conn.commit()
+
+    def clear(self):
+        with self._db_lock:
+            self._clear()
+            self._conn.commit()
@@ -0,0 +1,105 @@
+# utils/http_session.py
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from resumix.utils.logger import logger
+
+
+class HttpSessionPool:
+    """
+    进程内共享的 HTTP 连接池。
+
+    每个后端（deepseek / silicon / teleai / local ...）对应一个独立的
+    requests.Session，底层由 urllib3 连接池维持 keep-alive 长连接，
+    所有线程复用同一组连接，避免每次请求重新进行 TCP + TLS 握手。
+
+    注：requests/urllib3 仅支持 HTTP/1.1，此处通过 keep-alive 复用连接。
+    """
+
+    _sessions: Dict[str, requests.Session] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_session(
+        cls, name: str, pool_size: int = 10, max_retries: int = 0
+    ) -> requests.Session:
+        """
+        获取（或创建）指定名称的共享 Session。
+
+        参数：
+            name: 后端名称，用作连接池的键
+            pool_size: 每个主机最多保持的连接数
+            max_retries: 连接失败时的重试次数
+
+        返回：
+            共享的 requests.Session 实例。
+        """
+        session = cls._sessions.get(name)
+        if session is not None:
+            return session
+
+        with cls._lock:
+            if name not in cls._sessions:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=pool_size,
+                    pool_maxsize=pool_size,
+                    max_retries=max_retries,
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                cls._sessions[name] = session
+                logger.info(
+                    f"[HttpSessionPool] 创建连接池 '{name}'，pool_size={pool_size}"
+                )
+            return cls._sessions[name]
+
+    @classmethod
+    def get_stats(cls, name: Optional[str] = None) -> Dict[str, dict]:
+        """
+        获取连接池统计信息。
+
+        参数：
+            name: 后端名称，为 None 时返回全部连接池
+
+        返回：
+            {后端名称: {"hosts": {...}, "requests": n, "connections": n, "reused": n}}
+        """
+        names = [name] if name else list(cls._sessions.keys())
+        stats = {}
+        for key in names:
+            session = cls._sessions.get(key)
+            if session is None:
+                continue
+
+            adapter = session.get_adapter("https://")
+            pools = adapter.poolmanager.pools
+            hosts = {}
+            for pool_key in pools.keys():
+                pool = pools[pool_key]
+                hosts[f"{pool.scheme}://{pool.host}:{pool.port}"] = {
+                    "requests": pool.num_requests,
+                    "connections": pool.num_connections,
+                    "idle": pool.pool.qsize() if pool.pool else 0,
+                }
+
+            total_requests = sum(h["requests"] for h in hosts.values())
+            total_connections = sum(h["connections"] for h in hosts.values())
+            stats[key] = {
+                "hosts": hosts,
+                "requests": total_requests,
+                "connections": total_connections,
+                "reused": max(total_requests - total_connections, 0),
+            }
+        return stats
+
+    @classmethod
+    def close_all(cls):
+        """关闭所有连接池（进程退出或测试时调用）"""
+        with cls._lock:
+            for session in cls._sessions.values():
+                session.close()
+            cls._sessions.clear()
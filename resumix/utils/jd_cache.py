@@ -0,0 +1,116 @@
+# utils/jd_cache.py
+import hashlib
+import json
+import time
+from typing import Dict, Optional
+
+from resumix.config.config import Config
+from resumix.section.section_base import SectionBase
+from resumix.utils.logger import logger
+from resumix.utils.sqlite_store import SingletonSQLiteStore
+
+CONFIG = Config().config
+
+
+class JDCache(SingletonSQLiteStore):
+    """
+    跨会话、跨进程共享的 JD 解析缓存（SQLite）。
+
+    - jd_sections：正文哈希 → 解析后的 JD 段落，同一 JD 只调用一次 LLM；
+    - 网页抓取与重新验证由 UrlFetcher 的 HttpCache 负责，这里不再缓存网页；
+    - 使用 WAL 模式，多进程可同时读写。
+    """
+
+    # 段落序列化格式或解析逻辑变化时递增，使旧缓存失效
+    SECTIONS_VERSION = 1
+
+    TABLE = "jd_sections"
+    KEY_COLUMNS = ("content_hash",)
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jd_sections (
+            content_hash TEXT PRIMARY KEY,
+            sections TEXT NOT NULL,
+            created_at REAL NOT NULL
+        )
+    """
+
+    def __init__(
+        self,
+        path: str = "resumix/cache/jd_cache.db",
+        sections_ttl: int = 7 * 24 * 3600,
+    ):
+        """
+        参数：
+            path: SQLite 数据库文件路径
+            sections_ttl: 解析结果的有效期（秒），<= 0 表示永不过期
+        """
+        if self._initialized:
+            return
+        self.sections_ttl = sections_ttl
+        self._open(path)
+        self._initialized = True
+        logger.info(f"[JDCache] 缓存已启用: {path}")
+
+    @classmethod
+    def from_config(cls) -> Optional["JDCache"]:
+        """根据 config.yaml 中的 jd_parser.cache 配置创建缓存，未启用时返回 None"""
+        cache_config = getattr(getattr(CONFIG, "JD_PARSER", None), "CACHE", None)
+        if cache_config is None or not getattr(cache_config, "ENABLED", False):
+            return None
+        return cls(
+            path=getattr(cache_config, "PATH", "resumix/cache/jd_cache.db"),
+            sections_ttl=getattr(cache_config, "SECTIONS_TTL", 7 * 24 * 3600),
+        )
+
+    @staticmethod
+    def content_hash(text: str) -> str:
+        raw = f"v{JDCache.SECTIONS_VERSION}\n{text.strip()}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get_sections(self, content_hash: str) -> Optional[Dict[str, SectionBase]]:
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT sections, created_at FROM jd_sections WHERE content_hash = ?",
+                (content_hash,),
+            ).fetchone()
+        if row is None:
+            return None
+
+        data, created_at = row
+        if self.sections_ttl > 0 and time.time() - created_at > self.sections_ttl:
+            return None
+
+        sections = {}
+        for name, item in json.loads(data).items():
+            section = SectionBase(name, item["raw_text"])
+            section.original_lines = item["original_lines"]
+            section.parsed_data = item["parsed_data"]
+            sections[name] = section
+        logger.info(f"[JDCache] 命中 JD 解析缓存: {content_hash[:12]}")
+        return sections
+
+    def set_sections(self, content_hash: str, sections: Dict[str, SectionBase]):
+        data = {
+            name: {
+                "raw_text": section.raw_text,
+                "original_lines": getattr(section, "original_lines", section.lines),
+                "parsed_data": getattr(section, "parsed_data", None),
+            }
+            for name, section in sections.items()
+        }
+        with self._db_lock:
+            self._upsert_many(
+                [
+                    {
+                        "content_hash": content_hash,
+                        "sections": json.dumps(data, ensure_ascii=False),
+                        "created_at": time.time(),
+                    }
+                ]
+            )
+            self._conn.commit()
+
+    def clear(self):
+        with self._db_lock:
+            self._clear()
+            self._conn.commit()
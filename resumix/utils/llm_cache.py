@@ -0,0 +1,145 @@
+# utils/llm_cache.py
+import hashlib
+import json
+import time
+from typing import Optional
+
+from resumix.config.config import Config
+from resumix.utils.logger import logger
+from resumix.utils.sqlite_store import SingletonSQLiteStore
+
+CONFIG = Config().config
+
+
+class LLMResponseCache(SingletonSQLiteStore):
+    """
+    基于 SQLite 的 LLM 响应缓存（内容寻址）。
+
+    - 键：(provider, model, prompt, 生成参数) 的 SHA256；
+    - 支持 TTL 过期与按总字节数的 LRU 淘汰（见 SQLiteStore）；
+    - 使用 WAL 模式，多进程 / 多线程可同时读写；
+    - 记录命中 / 未命中次数，便于观察缓存效果。
+    """
+
+    TABLE = "llm_cache"
+    KEY_COLUMNS = ("key",)
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS llm_cache (
+            key TEXT PRIMARY KEY,
+            response TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            created_at REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        )
+    """
+
+    def __init__(
+        self,
+        path: str = "resumix/cache/llm_cache.db",
+        ttl: int = 7 * 24 * 3600,
+        max_bytes: int = 100 * 1024 * 1024,
+    ):
+        """
+        参数：
+            path: SQLite 数据库文件路径
+            ttl: 缓存有效期（秒），<= 0 表示永不过期
+            max_bytes: 缓存响应总字节数上限，超出后按最近访问时间淘汰
+        """
+        if self._initialized:
+            return
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._open(path, max_bytes)
+        self._initialized = True
+        logger.info(f"[LLMResponseCache] 缓存已启用: {path}")
+
+    @classmethod
+    def from_config(cls) -> Optional["LLMResponseCache"]:
+        """根据 config.yaml 中的 llm.cache 配置创建缓存，未启用时返回 None"""
+        cache_config = getattr(CONFIG.LLM, "CACHE", None)
+        if cache_config is None or not getattr(cache_config, "ENABLED", False):
+            return None
+        return cls(
+            path=getattr(cache_config, "PATH", "resumix/cache/llm_cache.db"),
+            ttl=getattr(cache_config, "TTL", 7 * 24 * 3600),
+            max_bytes=getattr(cache_config, "MAX_BYTES", 100 * 1024 * 1024),
+        )
+
+    @staticmethod
+    def make_key(provider: str, model: str, prompt: str, params: dict) -> str:
+        raw = json.dumps(
+            {
+                "provider": provider,
+                "model": model,
+                "prompt": prompt,
+                "params": params,
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            response, created_at = row
+            if self.ttl > 0 and now - created_at > self.ttl:
+                self._delete_where("key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+            return response
+
+    def set(self, key: str, response: str):
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        with self._db_lock:
+            self._upsert_many(
+                [
+                    {
+                        "key": key,
+                        "response": response,
+                        "size": size,
+                        "created_at": now,
+                        "accessed_at": now,
+                    }
+                ]
+            )
+            if self.ttl > 0:
+                self._delete_where("created_at < ?", (now - self.ttl,))
+            self._evict()
+            self._conn.commit()
+
+    def clear(self):
+        with self._db_lock:
+            self._clear()
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        with self._db_lock:
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries,
+            "bytes": total,
+        }
@@ -1,9 +1,14 @@
 from uuid import UUID
+import asyncio
 import requests
+import httpx
 import os
+import threading
+import weakref
+import json
 from langchain_core.language_models import BaseLLM
 from langchain_core.outputs import Generation, LLMResult
-from typing import Any, List, Optional, Dict
+from typing import Any, List, Optional, Dict, Tuple, Iterator
 from pydantic import Field
 from loguru import logger
 from dotenv import load_dotenv
@@ -12,12 +17,22 @@ import base64
 import time
 
 from resumix.config.llm_config import LLMConfig
+from resumix.utils.http_session import HttpSessionPool
+from resumix.utils.llm_cache import LLMResponseCache
 
 # Load environment variables
 load_dotenv()
 
 LLM_CONFIG = LLMConfig.get_config()
 
+# 各后端的生成参数，同时参与请求构造与缓存键计算
+GENERATION_PARAMS = {
+    "deepseek": {"temperature": 0.7, "max_tokens": 2000},
+    "silicon": {"max_tokens": 2000, "n": 1, "stop": []},
+    "teleai": {"max_tokens": 2000},
+    "local": {},
+}
+
 
 class LLMWrapper(BaseLLM):
     client: Any = Field(exclude=True)
@@ -61,6 +76,47 @@ class LLMWrapper(BaseLLM):
         return LLMResult(generations=generations)
 
 
+class ProviderLimiter:
+    """
+    进程内每个后端一个并发上限，LLMClient 的 generate / stream 与
+    AsyncLLMClient 共用同一个实例。
+
+    底层为 threading.BoundedSemaphore：同步调用阻塞等待；异步调用非阻塞地尝试获取，
+    失败时让出事件循环并退避重试，不占用线程池线程，也不与具体事件循环绑定。
+    """
+
+    _limiters: Dict[str, "ProviderLimiter"] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._semaphore = threading.BoundedSemaphore(limit)
+
+    @classmethod
+    def for_provider(cls, provider: str, limit: int) -> "ProviderLimiter":
+        with cls._lock:
+            if provider not in cls._limiters:
+                cls._limiters[provider] = cls(limit)
+            return cls._limiters[provider]
+
+    def __enter__(self):
+        self._semaphore.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self._semaphore.release()
+
+    async def __aenter__(self):
+        delay = 0.001
+        while not self._semaphore.acquire(blocking=False):
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.05)
+        return self
+
+    async def __aexit__(self, *exc):
+        self._semaphore.release()
+
+
 class LLMClient:
     _instance = None
 
@@ -88,6 +144,20 @@ class LLMClient:
         self.model_name = LLM_CONFIG.get("model", "local_llm")
         self.api_key = LLM_CONFIG.get("api_key", None)
         self.timeout = timeout
+        # 所有线程共享同一个带 keep-alive 的连接池
+        self.session = HttpSessionPool.get_session(
+            LLM_CONFIG.get("type", "local"),
+            pool_size=LLM_CONFIG.get("pool_size", 8),
+        )
+        self.cache = LLMResponseCache.from_config()
+        self._initialized = True
+
+    @staticmethod
+    def get_limiter() -> ProviderLimiter:
+        """当前后端在进程内共享的并发上限"""
+        return ProviderLimiter.for_provider(
+            LLM_CONFIG.get("type", "local"), LLM_CONFIG.get("max_concurrency", 8)
+        )
 
     def __call__(self, prompt: str) -> str:
         """
@@ -102,7 +172,7 @@ class LLMClient:
         logger.info(f"Calling: {prompt[:50]}")
         return self.generate(prompt)
 
-    def _call_deepseek_api(self, prompt: str) -> str:
+    def _build_deepseek_request(self, prompt: str) -> Tuple[dict, dict]:
         api_key = LLM_CONFIG.get("api_key", None)
 
         if not api_key:
@@ -115,50 +185,20 @@ class LLMClient:
         payload = {
             "model": self.model_name,
             "messages": [{"role": "user", "content": prompt}],
-            "temperature": 0.7,
-            "max_tokens": 2000,
+            **GENERATION_PARAMS["deepseek"],
         }
+        return payload, headers
 
-        res = requests.post(
-            self.base_url,
-            json=payload,
-            headers=headers,
-            timeout=self.timeout,
-        )
-
-        return (
-            res.json()
-            .get("choices", [{}])[0]
-            .get("message", {})
-            .get("content", "⚠️ Model did not return a result.")
-        )
-
-    def _call_local_llm(self, prompt: str) -> str:
-        """
-        调用本地 LLM 生成文本。
-
-        参数：
-            prompt: 输入提示文本
-
-        返回：
-            LLM 生成的字符串或错误信息。
-        """
+    def _build_local_request(self, prompt: str) -> Tuple[dict, dict]:
         payload = {
             "model": self.model_name,
             "prompt": prompt,
             "stream": False,
+            **GENERATION_PARAMS["local"],
         }
+        return payload, {}
 
-        res = requests.post(
-            self.base_url,
-            json=payload,
-            timeout=self.timeout,
-        )
-
-        return res.json().get("response", "⚠️ Model did not return a result.")
-
-    def _call_teleai_api(self, prompt: str) -> str:
-
+    def _build_teleai_request(self, prompt: str) -> Tuple[dict, dict]:
         account = LLM_CONFIG.get("username", "")
         timestamp = str(int(time.time()))
         secret = self.api_key
@@ -181,41 +221,107 @@ class LLMClient:
         payload = {
             "model": self.model_name,
             "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": 2000,
+            **GENERATION_PARAMS["teleai"],
         }
+        return payload, headers
 
-        res = requests.post(
+    def _build_silicon_request(self, prompt: str) -> Tuple[dict, dict]:
+        payload = {
+            "model": self.model_name,
+            "messages": [{"role": "user", "content": prompt}],
+            "stream": False,
+            **GENERATION_PARAMS["silicon"],
+        }
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+        return payload, headers
+
+    def build_request(self, prompt: str) -> Tuple[dict, dict]:
+        """
+        根据当前配置的后端构造请求体和请求头，同步与异步客户端共用。
+
+        返回：
+            (payload, headers)
+        """
+        provider = LLM_CONFIG.get("type")
+        if provider == "deepseek":
+            return self._build_deepseek_request(prompt)
+        elif provider == "silicon":
+            return self._build_silicon_request(prompt)
+        elif provider == "teleai":
+            return self._build_teleai_request(prompt)
+        else:
+            return self._build_local_request(prompt)
+
+    @staticmethod
+    def parse_response(data: dict) -> str:
+        """
+        从后端返回的 JSON 中提取生成文本，兼容 OpenAI 风格与 Ollama 风格。
+        """
+        if LLM_CONFIG.get("type") in ("deepseek", "silicon", "teleai"):
+            choices = data.get("choices") or [{}]
+            return (choices[0].get("message") or {}).get(
+                "content", "⚠️ Model did not return a result."
+            )
+        return data.get("response", "⚠️ Model did not return a result.")
+
+    def _call_deepseek_api(self, prompt: str) -> str:
+        payload, headers = self._build_deepseek_request(prompt)
+
+        res = self.session.post(
             self.base_url,
             json=payload,
             headers=headers,
             timeout=self.timeout,
         )
+        if not res.ok:
+            return f"❌ Error: {res.status_code} - {res.text}"
 
+        return self.parse_response(res.json())
+
+    def _call_local_llm(self, prompt: str) -> str:
+        """
+        调用本地 LLM 生成文本。
+
+        参数：
+            prompt: 输入提示文本
+
+        返回：
+            LLM 生成的字符串或错误信息。
+        """
+        payload, _ = self._build_local_request(prompt)
+
+        res = self.session.post(
+            self.base_url,
+            json=payload,
+            timeout=self.timeout,
+        )
         if not res.ok:
             return f"❌ Error: {res.status_code} - {res.text}"
 
-        return (
-            res.json()
-            .get("choices", [{}])[0]
-            .get("message", {})
-            .get("content", "⚠️ Model did not return a result.")
+        return self.parse_response(res.json())
+
+    def _call_teleai_api(self, prompt: str) -> str:
+        payload, headers = self._build_teleai_request(prompt)
+
+        res = self.session.post(
+            self.base_url,
+            json=payload,
+            headers=headers,
+            timeout=self.timeout,
         )
 
-    def _call_silicon_api(self, prompt: str) -> requests.Response:
-        payload = {
-            "model": self.model_name,
-            "messages": [{"role": "user", "content": prompt}],
-            "stream": False,
-            "max_tokens": 2000,
-            "n": 1,
-            "stop": [],
-        }
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
+        if not res.ok:
+            return f"❌ Error: {res.status_code} - {res.text}"
+
+        return self.parse_response(res.json())
+
+    def _call_silicon_api(self, prompt: str) -> str:
+        payload, headers = self._build_silicon_request(prompt)
 
-        res = requests.post(
+        res = self.session.post(
             self.base_url,
             json=payload,
             headers=headers,
@@ -224,26 +330,147 @@ class LLMClient:
         if not res.ok:
             return f"❌ Error: {res.status_code} - {res.text}"
 
-        return (
-            res.json()
-            .get("choices", [{}])[0]
-            .get("message", {})
-            .get("content", "⚠️ Model did not return a result.")
+        return self.parse_response(res.json())
+
+    def pool_stats(self) -> Dict[str, dict]:
+        """
+        返回当前后端连接池的统计信息（请求数、新建连接数、复用次数）。
+        """
+        return HttpSessionPool.get_stats(LLM_CONFIG.get("type", "local"))
+
+    def cache_key(self, prompt: str) -> Optional[str]:
+        """计算 prompt 的缓存键，未启用缓存时返回 None"""
+        if self.cache is None:
+            return None
+        provider = LLM_CONFIG.get("type", "local")
+        return LLMResponseCache.make_key(
+            provider,
+            self.model_name,
+            prompt,
+            GENERATION_PARAMS.get(provider, {}),
         )
 
+    @staticmethod
+    def is_cacheable(response: str) -> bool:
+        """错误信息和空结果不写入缓存"""
+        return bool(response) and not response.startswith(("❌", "⚠️"))
+
+    def cache_stats(self) -> Optional[dict]:
+        return self.cache.stats() if self.cache else None
+
     def generate(self, prompt: str) -> str:
         """
-        调用 LLM 生成文本。
+        调用 LLM 生成文本，优先读取响应缓存。
+
+        参数：
+            prompt: 输入提示文本
+
+        返回：
+            LLM 生成的字符串或错误信息。
+        """
+        key = self.cache_key(prompt)
+        if key:
+            cached = self.cache.get(key)
+            if cached is not None:
+                logger.info("[LLMClient] 命中响应缓存")
+                return cached
+
+        with self.get_limiter():
+            response = self._generate(prompt)
+
+        if key and self.is_cacheable(response):
+            self.cache.set(key, response)
+        return response
+
+    def stream(self, prompt: str) -> Iterator[str]:
+        """
+        流式调用 LLM，逐段产出生成的文本。
+
+        本地模型使用 Ollama /api/generate 的 NDJSON 流，其余后端使用
+        OpenAI 风格的 SSE（data: {...}）流。命中缓存时一次性产出完整结果，
+        流结束后将完整文本写入缓存。
+
+        与 generate 不同，请求失败时抛出 RuntimeError（消息以 ❌ 开头），
+        避免错误信息混入已产出的文本中。整个流式读取期间占用一个并发名额。
 
         参数：
             prompt: 输入提示文本
 
         返回：
-            LLM 生成的        logger.info(f"Raw string for signature: {raw_string}")
-                loger.ggger.info()                logger.info("Using DeepSeek API")
-                logger.info()                logger.info("Using TeleAI API")
-                logger.info()                logger.info("Using Local LLM")。
+            文本片段生成器。
         """
+        key = self.cache_key(prompt)
+        if key:
+            cached = self.cache.get(key)
+            if cached is not None:
+                logger.info("[LLMClient] 命中响应缓存")
+                yield cached
+                return
+
+        chunks = []
+        try:
+            logger.info(f"[LLMClient] Streaming, Prompt Length: {len(prompt)}")
+            payload, headers = self.build_request(prompt)
+            payload["stream"] = True
+
+            with (
+                self.get_limiter(),
+                self.session.post(
+                    self.base_url,
+                    json=payload,
+                    headers=headers,
+                    timeout=self.timeout,
+                    stream=True,
+                ) as res,
+            ):
+                if not res.ok:
+                    raise RuntimeError(f"❌ Error: {res.status_code} - {res.text}")
+
+                res.encoding = "utf-8"
+                if LLM_CONFIG.get("type") in ("deepseek", "silicon", "teleai"):
+                    pieces = self._iter_sse(res)
+                else:
+                    pieces = self._iter_ndjson(res)
+
+                for piece in pieces:
+                    chunks.append(piece)
+                    yield piece
+
+        except Exception as e:
+            if str(e).startswith("❌"):
+                raise
+            raise RuntimeError(f"❌ Error calling model: {e}") from e
+
+        response = "".join(chunks)
+        if key and self.is_cacheable(response):
+            self.cache.set(key, response)
+
+    @staticmethod
+    def _iter_ndjson(res: requests.Response) -> Iterator[str]:
+        for line in res.iter_lines(decode_unicode=True):
+            if not line:
+                continue
+            data = json.loads(line)
+            if data.get("response"):
+                yield data["response"]
+            if data.get("done"):
+                break
+
+    @staticmethod
+    def _iter_sse(res: requests.Response) -> Iterator[str]:
+        for line in res.iter_lines(decode_unicode=True):
+            if not line or not line.startswith("data:"):
+                continue
+            data = line[len("data:") :].strip()
+            if data == "[DONE]":
+                break
+            # 部分兼容 OpenAI 的后端会发送 choices 为空的块（如 usage 统计）
+            choices = json.loads(data).get("choices") or [{}]
+            delta = choices[0].get("delta") or {}
+            if delta.get("content"):
+                yield delta["content"]
+
+    def _generate(self, prompt: str) -> str:
         try:
             logger.info(f"Prompt Length: {len(prompt)}")
 
@@ -262,3 +489,145 @@ class LLMClient:
 
         except Exception as e:
             return f"❌ Error calling model: {e}"
+
+
+class AsyncLLMClient:
+    """
+    基于 asyncio + httpx 的异步 LLM 客户端。
+
+    - 复用 LLMClient 的请求构造与结果解析逻辑，支持全部四种后端；
+    - 与 LLMClient 共用同一个 ProviderLimiter，同步、异步与流式请求合计受并发上限约束；
+    - 提供 generate / generate_many 同步接口，方便现有同步调用方直接使用；
+      同步接口统一在一个常驻后台事件循环中执行，并发上限对所有调用线程生效。
+    """
+
+    _instance = None
+
+    def __new__(cls, timeout=60):
+        if cls._instance is None:
+            cls._instance = super(AsyncLLMClient, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self, timeout=60):
+        """
+        初始化异步 LLM 客户端。
+
+        参数：
+            timeout: 单个请求超时时间（秒）
+        """
+        if self._initialized:
+            return
+        self.sync_client = LLMClient(timeout=timeout)
+        self.provider = LLM_CONFIG.get("type", "local")
+        self.timeout = timeout
+        self.max_concurrency = LLM_CONFIG.get("max_concurrency", 8)
+        # httpx 客户端与具体事件循环绑定，按 loop 分别维护
+        self._clients = weakref.WeakKeyDictionary()
+        self._loop = None
+        self._loop_lock = threading.Lock()
+        self._initialized = True
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            try:
+                import h2  # noqa: F401
+
+                http2 = True
+            except ImportError:
+                http2 = False
+            client = httpx.AsyncClient(
+                timeout=self.timeout,
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+            )
+            self._clients[loop] = client
+        return client
+
+    async def aclose(self):
+        """关闭当前事件循环上的 httpx 客户端"""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    async def agenerate(self, prompt: str) -> str:
+        """
+        异步调用 LLM 生成文本。
+
+        参数：
+            prompt: 输入提示文本
+
+        返回：
+            LLM 生成的字符串或错误信息。
+        """
+        key = self.sync_client.cache_key(prompt)
+        if key:
+            # SQLite 读写会阻塞，放到线程中执行，避免卡住事件循环
+            cached = await asyncio.to_thread(self.sync_client.cache.get, key)
+            if cached is not None:
+                logger.info("[AsyncLLMClient] 命中响应缓存")
+                return cached
+
+        response = await self._agenerate(prompt)
+
+        if key and self.sync_client.is_cacheable(response):
+            await asyncio.to_thread(self.sync_client.cache.set, key, response)
+        return response
+
+    async def _agenerate(self, prompt: str) -> str:
+        try:
+            logger.info(f"[AsyncLLMClient] Prompt Length: {len(prompt)}")
+            payload, headers = self.sync_client.build_request(prompt)
+
+            async with self.sync_client.get_limiter():
+                res = await self._get_client().post(
+                    self.sync_client.base_url, json=payload, headers=headers
+                )
+
+            if not res.is_success:
+                return f"❌ Error: {res.status_code} - {res.text}"
+
+            return self.sync_client.parse_response(res.json())
+
+        except Exception as e:
+            return f"❌ Error calling model: {e}"
+
+    async def agenerate_many(self, prompts: List[str]) -> List[str]:
+        """
+        并发生成多个 prompt 的结果，并发度受 ProviderLimiter 限制，返回顺序与输入一致。
+        """
+        return await asyncio.gather(*(self.agenerate(p) for p in prompts))
+
+    def _background_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="async-llm-loop", daemon=True
+                ).start()
+                self._loop = loop
+            return self._loop
+
+    def _run_sync(self, coro_factory):
+        # 所有同步调用共用同一个事件循环，因此共享 httpx 连接池
+        loop = self._background_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            raise RuntimeError("不能在 AsyncLLMClient 的后台事件循环中调用同步接口")
+        return asyncio.run_coroutine_threadsafe(coro_factory(), loop).result()
+
+    def generate(self, prompt: str) -> str:
+        """agenerate 的同步包装"""
+        return self._run_sync(lambda: self.agenerate(prompt))
+
+    def generate_many(self, prompts: List[str]) -> List[str]:
+        """agenerate_many 的同步包装"""
+        return self._run_sync(lambda: self.agenerate_many(prompts))
@@ -0,0 +1,129 @@
+# utils/ocr_pool.py
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+from resumix.config.config import Config
+from resumix.utils.logger import logger
+
+CONFIG = Config().config
+
+
+class OCREnginePool:
+    """
+    进程级 OCR 模型池。
+
+    - 懒加载：首次借用时才构造模型，之后常驻内存；
+    - 最多保持 pool_size 个已加载的实例，借出 / 归还语义，供并发上传共享；
+    - 模型类型与数量由 config.yaml 的 ocr 配置块决定。
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(OCREnginePool, cls).__new__(cls)
+                    cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self, pool_size: int = None, model_type: str = None):
+        """
+        参数：
+            pool_size: 最多加载的 OCR 实例数，默认读取 ocr.pool_size
+            model_type: "paddleocr" 或 "easyocr"，默认读取 ocr.use_model
+        """
+        if self._initialized:
+            return
+        self.pool_size = pool_size or getattr(CONFIG.OCR, "POOL_SIZE", 1)
+        self.model_type = model_type or CONFIG.OCR.USE_MODEL
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._in_use = 0
+        self._create_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._initialized = True
+
+        if getattr(CONFIG.OCR, "PRELOAD", False):
+            threading.Thread(target=self.warm_up, daemon=True).start()
+
+    def _create_engine(self):
+        start = time.time()
+        if self.model_type == "easyocr":
+            import easyocr
+
+            engine = easyocr.Reader(
+                ["ch_sim", "en"],
+                gpu=CONFIG.OCR.EASYOCR.GPU,
+                model_storage_directory=CONFIG.OCR.EASYOCR.DIRECTORY,
+            )
+        elif self.model_type == "paddleocr":
+            from paddleocr import PaddleOCR
+
+            engine = PaddleOCR(use_angle_cls=True, lang="ch")
+        else:
+            raise ValueError(f"不支持的 OCR 模型类型：{self.model_type}")
+
+        logger.info(
+            f"[OCREnginePool] 加载 {self.model_type} 实例，"
+            f"耗时 {time.time() - start:.2f}s"
+        )
+        return engine
+
+    def acquire(self, timeout: float = None):
+        """
+        借出一个 OCR 实例：优先复用空闲实例；未达上限时新建；否则阻塞等待归还。
+        """
+        try:
+            engine = self._idle.get_nowait()
+        except queue.Empty:
+            # 先占位再加载，模型加载期间不阻塞其他线程的借还
+            with self._create_lock:
+                can_create = self._created < self.pool_size
+                if can_create:
+                    self._created += 1
+
+            if can_create:
+                try:
+                    engine = self._create_engine()
+                except Exception:
+                    with self._create_lock:
+                        self._created -= 1
+                    raise
+            else:
+                engine = self._idle.get(timeout=timeout)
+
+        with self._stats_lock:
+            self._in_use += 1
+        return engine
+
+    def release(self, engine):
+        with self._stats_lock:
+            self._in_use -= 1
+        self._idle.put(engine)
+
+    @contextmanager
+    def checkout(self, timeout: float = None):
+        engine = self.acquire(timeout=timeout)
+        try:
+            yield engine
+        finally:
+            self.release(engine)
+
+    def warm_up(self, count: int = 1):
+        """预先加载 count 个实例，避免首个请求承担模型加载时间"""
+        engines = [self.acquire() for _ in range(min(count, self.pool_size))]
+        for engine in engines:
+            self.release(engine)
+
+    def stats(self) -> dict:
+        return {
+            "model": self.model_type,
+            "pool_size": self.pool_size,
+            "loaded": self._created,
+            "in_use": self._in_use,
+            "idle": self._idle.qsize(),
+        }
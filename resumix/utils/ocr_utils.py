@@ -1,38 +1,74 @@
 import os
+import re
 import time
-import tempfile
 import fitz  # PyMuPDF
-from utils.logger import logger
+from resumix.utils.logger import logger
 from io import BytesIO
 from resumix.utils.timeit import timeit
-from typing import Union
+from typing import Dict, List, Optional, Tuple, Union
+from concurrent.futures import Future, ThreadPoolExecutor
 from PIL import Image
 import numpy as np
 
 
+# 文本层中被视为“有效”的字符：字母数字、中日韩文字、常见标点与空白
+_VALID_CHAR_PATTERN = re.compile(
+    r"[\w\s\u3000-\u303f\u4e00-\u9fff\uff00-\uffef"
+    r"\.,;:!?'\"()\[\]{}<>@#$%&*+\-=/\\|~`^_·•–—‘’“”…、，。；：！？（）【】《》]"
+)
+
+
 class OCRUtils:
-    def __init__(self, ocr_model=None, dpi: int = 100, keep_images: bool = False):
+    def __init__(
+        self,
+        ocr_model=None,
+        dpi: int = 100,
+        keep_images: bool = False,
+        use_text_layer: bool = True,
+        min_text_chars: int = 50,
+        min_valid_ratio: float = 0.85,
+        ocr_pool=None,
+        page_workers: int = 2,
+    ):
         """
         通用 OCR 提取器，可自动识别并使用 PaddleOCR 或 EasyOCR。
 
+        对于带文本层的 PDF（多数导出的电子简历），优先直接读取文本层，
+        仅当文本层缺失或质量过低时才对该页执行 OCR。
+
         参数：
             ocr_model: 已初始化的 OCR 模型（PaddleOCR 或 EasyOCR 的 reader）。
             dpi: 渲染 PDF 图像的分辨率。
-            keep_images: 是否保留中间图像文件（调试用）。
+            keep_images: 是否额外将渲染的页面保存为 PNG（仅调试用）。
+            use_text_layer: 是否启用 PDF 文本层快速通道。
+            min_text_chars: 文本层有效的最少字符数（去除空白后）。
+            min_valid_ratio: 文本层中有效字符的最低占比，低于则视为乱码。
+            ocr_pool: 可选的 OCREnginePool，需要 OCR 时才从池中借用模型。
+            page_workers: 并行 OCR 的页面数（仅在使用 ocr_pool 时生效）。
         """
         self.ocr_model = ocr_model
+        self.ocr_pool = ocr_pool
+        self.page_workers = max(1, page_workers)
         self.dpi = dpi
         self.keep_images = keep_images
-        self.backend = self._detect_backend()
+        self.use_text_layer = use_text_layer
+        self.min_text_chars = min_text_chars
+        self.min_valid_ratio = min_valid_ratio
+        # 最近一次 extract_text 的逐页处理记录
+        self.page_report: List[Dict] = []
+        if ocr_model is None and ocr_pool is None:
+            raise ValueError("OCR model cannot be None.")
+        self.backend = self._detect_backend(ocr_model) if ocr_model else None
         os.environ["FLAGS_use_mkldnn"] = "1"
         os.environ["OMP_NUM_THREADS"] = "4"  # 视 CPU 核心数设置
 
-    def _detect_backend(self):
-        if self.ocr_model is None:
+    @staticmethod
+    def _detect_backend(ocr_model):
+        if ocr_model is None:
             raise ValueError("OCR model cannot be None.")
-        if hasattr(self.ocr_model, "ocr"):
+        if hasattr(ocr_model, "ocr"):
             return "paddle"
-        elif hasattr(self.ocr_model, "readtext"):
+        elif hasattr(ocr_model, "readtext"):
             return "easyocr"
         else:
             raise TypeError("Unsupported OCR model type.")
@@ -48,83 +84,167 @@ class OCRUtils:
     def save_image_disk(self, pix: fitz.Pixmap, path: str):
         pix.save(path)
 
+    @staticmethod
+    def pixmap_to_array(pix: fitz.Pixmap) -> np.ndarray:
+        """
+        将 Pixmap 的原始像素直接转换为 NumPy 数组（BGR 通道顺序），
+        不经过 PNG 编解码，也不落盘。
+        """
+        img = np.frombuffer(pix.samples, dtype=np.uint8).reshape(
+            pix.height, pix.width, pix.n
+        )
+        if pix.n == 1:
+            return np.ascontiguousarray(np.repeat(img, 3, axis=2))
+        # PaddleOCR / EasyOCR 均按 OpenCV 约定读取 BGR
+        return np.ascontiguousarray(img[:, :, 2::-1])
+
     @timeit()
-    def _perform_ocr_file(self, image_path: str) -> str:
+    def _perform_ocr(self, image: np.ndarray) -> str:
+        """
+        执行 OCR：配置了模型池时从池中借用实例，否则使用构造时传入的模型。
+        """
+        if self.ocr_pool is not None:
+            with self.ocr_pool.checkout() as engine:
+                return self._run_engine(engine, self._detect_backend(engine), image)
+        return self._run_engine(self.ocr_model, self.backend, image)
+
+    @staticmethod
+    def _run_engine(engine, backend: str, image: np.ndarray) -> str:
         """
         根据后端类型执行 OCR，并返回提取的文本。
         """
-        if self.backend == "paddle":
-            result = self.ocr_model.ocr(image_path, cls=True)
+        if backend == "paddle":
+            result = engine.ocr(image, cls=True)
             return "\n".join([line[1][0] for block in result for line in block])
-        elif self.backend == "easyocr":
-            result = self.ocr_model.readtext(image_path)
+        elif backend == "easyocr":
+            result = engine.readtext(image)
             return "\n".join([text for (_, text, _) in result])
         else:
-            raise ValueError(f"不支持的 OCR 后端类型：{self.backend}")
+            raise ValueError(f"不支持的 OCR 后端类型：{backend}")
 
     @timeit()
-    def extract_text(self, pdf_file, max_pages: int = 2) -> str:
-        logger.info(">>> OCRUtils.extract_text 开始执行")
-        start_time = time.time()
+    def extract_text(self, pdf_file, max_pages: Optional[int] = None) -> str:
+        """
+        提取 PDF 文本。
 
-        temp_pdf_path = self._save_pdf_tempfile(pdf_file)
-        doc = self._open_pdf(temp_pdf_path)
+        参数：
+            pdf_file: 上传文件 / 文件对象 / bytes
+            max_pages: 最多处理的页数，None 表示处理全部页面
 
-        full_text = self._process_pages(doc, max_pages)
+        返回：
+            按 "--- Page N ---" 分隔的全文。
+        """
+        logger.info(">>> OCRUtils.extract_text 开始执行")
+        start_time = time.time()
 
-        self._cleanup_temp_file(temp_pdf_path)
+        doc = self._open_pdf(self._read_pdf_bytes(pdf_file))
 
+        try:
+            full_text = self._process_pages(doc, max_pages)
+        finally:
+            doc.close()
+
+        for entry in self.page_report:
+            logger.info(
+                f"[报告] 第 {entry['page']} 页: {entry['method']}，字符数 {entry['chars']}"
+            )
         logger.info(
             f"[总耗时] extract_text 完成，总耗时: {time.time() - start_time:.2f}s"
         )
         return full_text.strip()
 
-    @timeit()
-    def _save_pdf_tempfile(self, pdf_file) -> str:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
+    def _read_pdf_bytes(self, pdf_file) -> bytes:
+        """读取上传文件（UploadedFile / 文件对象 / bytes）的全部内容"""
+        if isinstance(pdf_file, (bytes, bytearray)):
+            content = bytes(pdf_file)
+        elif hasattr(pdf_file, "getvalue"):
+            content = pdf_file.getvalue()
+        else:
             content = pdf_file.read()
-            if not content:
-                raise ValueError("上传的 PDF 文件内容为空。")
-            temp_file.write(content)
-            temp_pdf_path = temp_file.name
-        logger.info(f"[阶段] PDF 已保存为临时文件: {temp_pdf_path}")
-        return temp_pdf_path
-
-    def _open_pdf(self, path: str):
-        doc = fitz.open(path)
+        if not content:
+            raise ValueError("上传的 PDF 文件内容为空。")
+        return content
+
+    def _open_pdf(self, content: bytes):
+        doc = fitz.open(stream=content, filetype="pdf")
         logger.info(f"[阶段] 成功打开 PDF，共 {len(doc)} 页")
         return doc
 
-    def _cleanup_temp_file(self, path: str):
-        try:
-            os.remove(path)
-        except Exception as e:
-            logger.warning(f"删除临时 PDF 失败: {e}")
+    def _is_text_layer_usable(self, text: str) -> bool:
+        """
+        判断文本层是否可直接使用：字符数足够，且乱码（无法映射的字形、
+        替换字符、私有区字符等）占比足够低。
+        """
+        compact = re.sub(r"\s+", "", text)
+        if len(compact) < self.min_text_chars:
+            return False
+        if "(cid:" in text:
+            return False
+        valid = len(_VALID_CHAR_PATTERN.findall(compact))
+        return valid / len(compact) >= self.min_valid_ratio
 
     @timeit()
-    def _process_pages(self, doc, max_pages: int) -> str:
-        full_text = ""
-        for i in range(min(len(doc), max_pages)):
-            logger.info(f"[阶段] 处理第 {i+1} 页")
-            page = doc.load_page(i)
-
-            pix = self._render_page_to_image(page)
-            img_path = f"temp_page_{i}.png"
-            self.save_image_disk(pix, img_path)
-
-            logger.info(f"[阶段] 开始 OCR 识别：{img_path}")
-            t1 = time.time()
-            page_text = self._perform_ocr_file(img_path)
-            logger.info(f"[耗时] OCR 推理耗时: {time.time() - t1:.2f}s")
+    def _process_pages(self, doc, max_pages: Optional[int]) -> str:
+        """
+        流水线处理页面：主线程依次读取文本层 / 渲染页面，需要 OCR 的页面
+        提交到线程池，渲染第 i+1 页的同时识别第 i 页，最后按页码顺序拼接。
+        """
+        page_count = len(doc) if max_pages is None else min(len(doc), max_pages)
+        # 直接传入的单个模型不能被多个线程同时使用
+        workers = self.page_workers if self.ocr_pool is not None else 1
+        max_in_flight = workers * 2
+
+        results: Dict[int, Tuple[str, str]] = {}
+        pending: Dict[int, Future] = {}
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for i in range(page_count):
+                logger.info(f"[阶段] 处理第 {i+1} 页")
+                page = doc.load_page(i)
+
+                if self.use_text_layer:
+                    layer_text = page.get_text("text").strip()
+                    if self._is_text_layer_usable(layer_text):
+                        logger.info(f"[阶段] 第 {i+1} 页使用 PDF 文本层，跳过 OCR")
+                        results[i] = ("text_layer", layer_text)
+                        continue
+                    logger.info(f"[阶段] 第 {i+1} 页文本层缺失或质量不足，回退 OCR")
+
+                pix = self._render_page_to_image(page)
+                if self.keep_images:
+                    self.save_image_disk(pix, f"page_{i + 1}.png")
+
+                # 控制在途页面数量，避免渲染过快堆积大量图像
+                if len(pending) >= max_in_flight:
+                    oldest = min(pending)
+                    results[oldest] = ("ocr", pending.pop(oldest).result())
+
+                logger.info(f"[阶段] 提交 OCR 识别：第 {i+1} 页")
+                pending[i] = executor.submit(
+                    self._ocr_page, i, self.pixmap_to_array(pix)
+                )
+
+            for i, future in pending.items():
+                results[i] = ("ocr", future.result())
 
+        full_text = ""
+        self.page_report = []
+        for i in range(page_count):
+            method, page_text = results[i]
+            self.page_report.append(
+                {"page": i + 1, "method": method, "chars": len(page_text)}
+            )
             full_text += f"\n--- Page {i + 1} ---\n{page_text}"
 
-            if not self.keep_images:
-                self._cleanup_temp_file(img_path)
-
         return full_text
 
+    def _ocr_page(self, index: int, image: np.ndarray) -> str:
+        t1 = time.time()
+        page_text = self._perform_ocr(image)
+        logger.info(f"[耗时] 第 {index+1} 页 OCR 推理耗时: {time.time() - t1:.2f}s")
+        return page_text
+
     @timeit()
     def _render_page_to_image(self, page):
-        pix = page.get_pixmap(dpi=self.dpi)
+        pix = page.get_pixmap(dpi=self.dpi, alpha=False)
         return pix
@@ -1,12 +1,12 @@
 from utils.ocr_utils import OCRUtils
 import streamlit as st
-from paddleocr import PaddleOCR
 from resumix.section_parser.vector_parser import VectorParser
 from resumix.section_parser.jd_vector_parser import JDVectorParser
 from resumix.utils.llm_client import LLMClient
 from resumix.utils.logger import logger
 from resumix.utils.url_fetcher import UrlFetcher
-import easyocr
+from resumix.utils.jd_cache import JDCache
+from resumix.utils.ocr_pool import OCREnginePool
 
 from resumix.config.config import Config
 
@@ -17,24 +17,29 @@ CONFIG = Config().config
 def extract_text_from_pdf(file):
     logger.info("Extracting text from PDF file...")
 
-    ocr_model = None
+    # 进程内共享已加载的 OCR 模型，仅在页面缺少文本层时才借用
+    ocr = OCRUtils(
+        ocr_pool=OCREnginePool(),
+        dpi=50,
+        keep_images=False,
+        page_workers=getattr(CONFIG.OCR, "PAGE_WORKERS", 2),
+    )
 
-    if CONFIG.OCR.USE_MODEL == "easyocr":
-        ocr_model = easyocr.Reader(
-            ["ch_sim", "en"],
-            gpu=CONFIG.OCR.EASYOCR.GPU,
-            model_storage_directory=CONFIG.OCR.EASYOCR.DIRECTORY,
-        )
-    elif CONFIG.OCR.USE_MODEL == "paddleocr":
-        ocr_model = PaddleOCR(use_angle_cls=True, lang="ch")
+    return ocr.extract_text(file, max_pages=getattr(CONFIG.OCR, "MAX_PAGES", None))
 
-    ocr = OCRUtils(ocr_model, dpi=50, keep_images=False)
 
-    return ocr.extract_text(file, max_pages=1)
+@st.cache_resource(show_spinner="正在加载解析模型...")
+def get_resume_parser() -> VectorParser:
+    return VectorParser()
+
+
+@st.cache_resource(show_spinner="正在加载解析模型...")
+def get_jd_parser() -> JDVectorParser:
+    return JDVectorParser()
 
 
 def extract_job_description(jd_url):
-    jd_parser = JDVectorParser()
+    jd_parser = get_jd_parser()
     jd_content = jd_parser.parse(jd_url)
     return jd_content
 
@@ -79,7 +84,7 @@ class SessionUtils:
     def get_resume_sections():
         if "resume_sections" not in st.session_state:
             text = SessionUtils.get_resume_text()
-            parser = VectorParser()
+            parser = get_resume_parser()
             st.session_state.resume_sections = parser.parse_resume(text)
         return st.session_state.resume_sections
 
@@ -128,14 +133,37 @@ class SessionUtils:
         ):
             logger.info(f"[SessionUtils] 当前url: {url}, 缓存url: {url}")
             logger.info("[SessionUtils] JD URL 未变化，使用缓存内容")
+            SessionUtils._swap_in_llm_jd_sections()
             return st.session_state.jd_sections
         try:
             logger.info(f"[SessionUtils] Fetching and parsing JD from: {url}")
+            # 网页由 UrlFetcher 的 HTTP 缓存重新验证；同一正文跨会话只解析一次
+            jd_cache = JDCache.from_config()
             jd_text = UrlFetcher.fetch(url)
+            if not jd_text.strip():
+                # 抓取失败：不解析、不缓存，也不记录 URL，下次刷新时重试
+                logger.warning(f"[SessionUtils] 未能获取 JD 正文: {url}")
+                st.session_state.pop("jd_speculative", None)
+                st.session_state.jd_sections = {
+                    "overview": ["❌ 无法获取 JD 网页内容，请检查链接后重试"]
+                }
+                st.session_state.jd_content = "❌ 无法获取 JD 网页内容"
+                return st.session_state.jd_sections
             st.session_state.jd_content = jd_text
 
-            parser = JDVectorParser()
-            st.session_state.jd_sections = parser.parse(jd_text)
+            content_hash = JDCache.content_hash(jd_text)
+            cached_sections = jd_cache.get_sections(content_hash) if jd_cache else None
+            if cached_sections is not None:
+                st.session_state.jd_sections = cached_sections
+                st.session_state.pop("jd_speculative", None)
+            else:
+                # 向量解析结果先行展示，LLM 结果在截止时间内到达后于下次刷新时替换
+                parser = get_jd_parser()
+                speculative = parser.parse_speculative(jd_text)
+                st.session_state.jd_sections = speculative.provisional()
+                st.session_state.jd_speculative = speculative
+                st.session_state.jd_content_hash = content_hash
+                SessionUtils._swap_in_llm_jd_sections()
 
             st.session_state.jd_cached_url = url  # 缓存 URL
 
@@ -147,6 +175,22 @@ class SessionUtils:
             st.session_state.jd_content = f"❌ 无法获取 JD 网页内容：{e}"
             return st.session_state.jd_sections
 
+    @staticmethod
+    def _swap_in_llm_jd_sections():
+        speculative = st.session_state.get("jd_speculative")
+        if speculative is None:
+            return
+        sections, source = speculative.current()
+        if source == "llm":
+            logger.info("[SessionUtils] LLM JD 解析完成，替换向量解析结果")
+            st.session_state.jd_sections = sections
+            # 仅缓存通过校验的 LLM 结果，向量结果下次仍可被 LLM 结果替换
+            jd_cache = JDCache.from_config()
+            if jd_cache and JDVectorParser.is_valid_llm_sections(sections):
+                jd_cache.set_sections(st.session_state.jd_content_hash, sections)
+        if speculative.is_final:
+            del st.session_state["jd_speculative"]
+
     @staticmethod
     def get_section_raw(section_name: str) -> str:
         sections = SessionUtils.get_resume_sections()
@@ -0,0 +1,161 @@
+# utils/sqlite_store.py
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+
+from resumix.utils.logger import logger
+
+
+class SQLiteStore:
+    """
+    SQLite 磁盘缓存的公共部分：WAL 连接、建表、按总字节数的 LRU 淘汰。
+
+    子类声明 TABLE / KEY_COLUMNS / SCHEMA；启用淘汰（max_bytes 不为 None）时，
+    表中需包含 size 与 accessed_at 两列，本类会为 accessed_at 建索引。
+
+    - 写入时维护 size 的运行总和，只在超出上限时才淘汰，避免每次写入都全表求和；
+    - 多进程共享同一文件时，每隔 RESYNC_INTERVAL 秒从数据库重新统计一次总和；
+    - 淘汰按 accessed_at 从旧到新分批删除，直到低于上限。
+
+    子类在持有 self._db_lock 时调用 _upsert_many / _delete_where / _evict，并自行 commit。
+    """
+
+    TABLE: str = ""
+    KEY_COLUMNS: Sequence[str] = ("key",)
+    SCHEMA: str = ""
+    RESYNC_INTERVAL = 60
+    EVICT_BATCH = 256
+
+    def _open(self, path: str, max_bytes: Optional[int] = None):
+        """
+        打开（必要时创建）数据库并建表。
+
+        参数：
+            path: SQLite 数据库文件路径
+            max_bytes: size 列总和的上限，None 表示不做容量淘汰
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self._db_lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._migrate()
+        self._conn.execute(self.SCHEMA)
+        if max_bytes is not None:
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.TABLE}_accessed "
+                f"ON {self.TABLE} (accessed_at)"
+            )
+            self._resync()
+        self._conn.commit()
+
+    def _migrate(self):
+        """建表前的结构迁移，子类按需覆盖"""
+
+    def _resync(self):
+        self._total_bytes = self._conn.execute(
+            f"SELECT COALESCE(SUM(size), 0) FROM {self.TABLE}"
+        ).fetchone()[0]
+        self._synced_at = time.time()
+
+    def _key_clause(self) -> str:
+        return " AND ".join(f"{column} = ?" for column in self.KEY_COLUMNS)
+
+    def _upsert_many(self, rows: List[Dict]):
+        """INSERT OR REPLACE 多行，并按被替换行的大小修正运行总和"""
+        if not rows:
+            return
+        columns = list(rows[0].keys())
+        if self.max_bytes is not None:
+            for row in rows:
+                old = self._conn.execute(
+                    f"SELECT size FROM {self.TABLE} WHERE {self._key_clause()}",
+                    [row[column] for column in self.KEY_COLUMNS],
+                ).fetchone()
+                self._total_bytes += row["size"] - (old[0] if old else 0)
+        self._conn.executemany(
+            f"INSERT OR REPLACE INTO {self.TABLE} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))})",
+            [[row[column] for column in columns] for row in rows],
+        )
+
+    def _delete_where(self, where: str, params: Sequence = ()) -> int:
+        """按条件删除，返回删除行数"""
+        if self.max_bytes is not None:
+            self._total_bytes -= self._conn.execute(
+                f"SELECT COALESCE(SUM(size), 0) FROM {self.TABLE} WHERE {where}",
+                params,
+            ).fetchone()[0]
+        return self._conn.execute(
+            f"DELETE FROM {self.TABLE} WHERE {where}", params
+        ).rowcount
+
+    def _evict(self) -> int:
+        """超出 max_bytes 时按最近访问时间淘汰，返回淘汰行数"""
+        if self.max_bytes is None:
+            return 0
+        if time.time() - self._synced_at > self.RESYNC_INTERVAL:
+            self._resync()
+        evicted = 0
+        while self._total_bytes > self.max_bytes:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(self.KEY_COLUMNS)}, size FROM {self.TABLE} "
+                f"ORDER BY accessed_at ASC LIMIT ?",
+                (self.EVICT_BATCH,),
+            ).fetchall()
+            if not rows:
+                self._total_bytes = 0
+                break
+            doomed = []
+            for *key, size in rows:
+                if self._total_bytes <= self.max_bytes:
+                    break
+                doomed.append(key)
+                self._total_bytes -= size
+            self._conn.executemany(
+                f"DELETE FROM {self.TABLE} WHERE {self._key_clause()}", doomed
+            )
+            evicted += len(doomed)
+        if evicted:
+            logger.info(f"[{type(self).__name__}] LRU 淘汰 {evicted} 条缓存")
+        return evicted
+
+    def _clear(self):
+        self._conn.execute(f"DELETE FROM {self.TABLE}")
+        if self.max_bytes is not None:
+            self._total_bytes = 0
+
+    def close(self):
+        with self._db_lock:
+            self._conn.close()
+
+
+class SingletonSQLiteStore(SQLiteStore):
+    """
+    进程内单例的 SQLiteStore：每个子类各一个实例，子类 __init__ 以
+    self._initialized 判断是否已初始化。
+    """
+
+    _instances: Dict[type, "SingletonSQLiteStore"] = {}
+    _instances_lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with SingletonSQLiteStore._instances_lock:
+            instance = SingletonSQLiteStore._instances.get(cls)
+            if instance is None:
+                instance = super().__new__(cls)
+                instance._initialized = False
+                SingletonSQLiteStore._instances[cls] = instance
+        return instance
+
+    @classmethod
+    def reset(cls):
+        """关闭并丢弃当前实例，下次构造时按新参数重新打开"""
+        with SingletonSQLiteStore._instances_lock:
+            instance = SingletonSQLiteStore._instances.pop(cls, None)
+        if instance is not None and instance._initialized:
+            instance.close()
@@ -1,75 +1,527 @@
+import asyncio
+import multiprocessing
+import threading
 import requests
+import httpx
 import chardet
 from readability import Document
-from bs4 import BeautifulSoup
 from resumix.utils.logger import logger
+from resumix.utils.http_session import HttpSessionPool
+from resumix.utils.http_cache import HttpCache
+from resumix.config.config import Config
 import trafilatura
+import codecs
+import copy
+import re
+import lxml.html
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import AsyncIterator, Iterable, Optional
+from urllib.parse import urlsplit
+
+CONFIG = Config().config
+
+# urllib3 仅在安装 brotli 时才能解码 br 响应
+try:
+    import brotli  # noqa: F401
+
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+
+_BOMS = [
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+_CONTENT_TYPE_CHARSET = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.I)
+_META_CHARSET = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?\s*([\w.:-]+)", re.I)
+# 常见的“名不副实”编码声明，替换为兼容的超集（键为 codecs.lookup 规范化后的名称）
+_ENCODING_ALIASES = {
+    "gb2312": "gb18030",
+    "gbk": "gb18030",
+    "iso8859-1": "cp1252",
+    "ascii": "cp1252",
+}
+
+
+def _normalize_encoding(name) -> Optional[str]:
+    if not name:
+        return None
+    if isinstance(name, bytes):
+        name = name.decode("ascii", errors="ignore")
+    try:
+        name = codecs.lookup(name.strip().lower()).name
+    except LookupError:
+        return None
+    return _ENCODING_ALIASES.get(name, name)
+
+
+# 常见招聘网站的职位描述区域，命中时跳过通用正文提取
+JOB_BOARD_RULES = {
+    "amazon.jobs": [
+        "//div[@id='job-detail-body']//div[contains(@class, 'section')]",
+    ],
+    "greenhouse.io": [
+        "//div[contains(@class, 'job__description')]",
+        "//div[@id='content']",
+    ],
+    "lever.co": [
+        "//div[contains(@class, 'posting-page')]"
+        "//div[contains(@class, 'section') and contains(@class, 'page-centered')"
+        " and not(contains(@class, 'last-section-apply'))]",
+    ],
+}
+
+_parser_local = threading.local()
+
+
+def _html_parser() -> lxml.html.HTMLParser:
+    # lxml 解析器对象不是线程安全的，每个线程各持有一个
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        # 解码后的文本统一以 UTF-8 交给 lxml，避免其根据 <meta charset> 重新解码
+        parser = _parser_local.parser = lxml.html.HTMLParser(
+            encoding="utf-8", remove_comments=True
+        )
+    return parser
+
+
+def _text_lines(element) -> list:
+    for bad in element.xpath(".//script | .//style | .//noscript"):
+        bad.drop_tree()
+    return [text.strip() for text in element.itertext() if text.strip()]
+
+
+def _extract_page(content: bytes, content_type: Optional[str], url: str) -> str:
+    # 在进程池中执行：解码 + 正文提取均为 CPU 密集操作
+    return UrlFetcher.extract_text(UrlFetcher.decode_html(content, content_type), url)
 
 
 class UrlFetcher:
+    """
+    共享的网页抓取器。
+
+    - 复用 HttpSessionPool 中的 "url_fetcher" 连接池（keep-alive）；
+    - 磁盘 HTTP 缓存：max-age 内直接复用，过期后以 If-None-Match /
+      If-Modified-Since 重新验证，304 时使用缓存内容；
+    - 流式下载并限制解压后的响应体大小；支持 gzip / deflate / brotli。
+    """
+
+    HEADERS = {
+        "User-Agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/115.0.0.0 Safari/537.36"
+        ),
+        "Accept-Encoding": _ACCEPT_ENCODING,
+    }
+
+    _process_pool: Optional[ProcessPoolExecutor] = None
+    _pool_lock = threading.Lock()
+
+    @staticmethod
+    def _config(key: str, default):
+        return getattr(getattr(CONFIG, "URL_FETCHER", None), key, default)
+
+    @staticmethod
+    def _session() -> requests.Session:
+        return HttpSessionPool.get_session(
+            "url_fetcher",
+            pool_size=UrlFetcher._config("POOL_SIZE", 10),
+            max_retries=UrlFetcher._config("MAX_RETRIES", 1),
+        )
+
+    @staticmethod
+    def _download(response: requests.Response, max_bytes: int) -> bytes:
+        length = response.headers.get("Content-Length", "")
+        if length.isdigit() and int(length) > max_bytes:
+            raise ValueError(f"响应体过大: {length} 字节 > {max_bytes}")
+
+        # iter_content 返回解压后的数据，按解压后大小计数，防止压缩炸弹
+        chunks, total = [], 0
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            total += len(chunk)
+            if total > max_bytes:
+                raise ValueError(f"响应体超过上限 {max_bytes} 字节，已中止下载")
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    @staticmethod
+    def get(url: str, timeout: Optional[int] = None) -> dict:
+        """
+        下载网页原始内容。
+
+        网页级缓存完全由 HttpCache 负责：max-age 内直接返回缓存内容，
+        过期后以 If-None-Match / If-Modified-Since 重新验证，304 时沿用缓存内容。
+
+        参数：
+            url: 网页地址
+            timeout: 请求超时时间（秒），默认读取 url_fetcher.timeout
+
+        返回：
+            {"content": bytes, "content_type": ..., "etag": ...,
+             "last_modified": ..., "from_cache": bool}
+
+        异常：
+            requests.RequestException：请求失败；ValueError：响应体超过上限。
+        """
+        timeout = timeout or UrlFetcher._config("TIMEOUT", 10)
+        max_bytes = UrlFetcher._config("MAX_BYTES", 5 * 1024 * 1024)
+
+        cache = HttpCache.from_config()
+        cached = cache.get(url) if cache else None
+        if cached and cached["fresh"]:
+            logger.info(f"[WebExtract] 命中 HTTP 缓存: {url}")
+            return {"from_cache": True, **cached}
+
+        headers = dict(UrlFetcher.HEADERS)
+        if cached and cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        with UrlFetcher._session().get(
+            url, headers=headers, timeout=timeout, stream=True
+        ) as response:
+            logger.info(f"[WebExtract] 状态码: {response.status_code}")
+            if response.status_code == 304 and cached:
+                logger.info(f"[WebExtract] 内容未变化 (304)，使用缓存: {url}")
+                cache.refresh(url, response.headers)
+                return {"from_cache": True, **cached}
+            response.raise_for_status()
+
+            content = UrlFetcher._download(response, max_bytes)
+            if cache:
+                cache.set(url, response.headers, content)
+            return {
+                "content": content,
+                "content_type": response.headers.get("Content-Type"),
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "from_cache": False,
+            }
+
+    @staticmethod
+    def resolve_encoding(
+        content: bytes,
+        content_type: Optional[str] = None,
+        detect_bytes: int = 16 * 1024,
+    ) -> str:
+        """
+        确定网页编码，按开销从低到高依次尝试：
+        BOM → HTTP Content-Type → <meta charset> → UTF-8 严格解码 → chardet（仅检测前缀）。
+
+        参数：
+            content: 响应体
+            content_type: HTTP Content-Type 头
+            detect_bytes: chardet 检测的最大字节数
+
+        返回：
+            Python 可识别的编码名称。
+        """
+        for bom, encoding in _BOMS:
+            if content.startswith(bom):
+                return encoding
+
+        if content_type:
+            match = _CONTENT_TYPE_CHARSET.search(content_type)
+            encoding = _normalize_encoding(match.group(1) if match else None)
+            if encoding:
+                return encoding
+
+        # <meta charset> 按规范应出现在文档前 1024 字节内，这里放宽到 4KB
+        match = _META_CHARSET.search(content[:4096])
+        encoding = _normalize_encoding(match.group(1) if match else None)
+        if encoding:
+            return encoding
+
+        try:
+            content.decode("utf-8")
+            return "utf-8"
+        except UnicodeDecodeError:
+            pass
+
+        detected = chardet.detect(content[:detect_bytes])
+        return _normalize_encoding(detected["encoding"]) or "utf-8"
+
+    @staticmethod
+    def decode_html(content: bytes, content_type: Optional[str] = None) -> str:
+        encoding = UrlFetcher.resolve_encoding(content, content_type)
+        logger.info(f"[WebExtract] 检测编码: {encoding}")
+        return content.decode(encoding, errors="replace")
+
     @staticmethod
     def fetch(url: str, timeout: int = 10) -> str:
+        """
+        抓取网页并提取正文，请求失败时返回空字符串。
+        """
         logger.info(f"[WebExtract] 开始抓取 URL: {url}")
 
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/115.0.0.0 Safari/537.36"
-            )
-        }
-
         try:
-            # Step 1: 网页抓取
-            response = requests.get(url, headers=headers, timeout=timeout)
+            result = UrlFetcher.get(url, timeout)
+            html = UrlFetcher.decode_html(result["content"], result["content_type"])
+            return UrlFetcher.extract_text(html, url)
+
+        except requests.RequestException as e:
+            logger.error(f"[WebExtract] 请求异常: {e}")
+        except Exception as e:
+            logger.error(f"[WebExtract] 未知异常: {e}")
+
+        return ""
+
+    @classmethod
+    def _extract_pool(cls) -> ProcessPoolExecutor:
+        with cls._pool_lock:
+            if cls._process_pool is None:
+                # 宿主进程（Streamlit / torch）是多线程的，fork 可能复制已持有的锁
+                cls._process_pool = ProcessPoolExecutor(
+                    max_workers=cls._config("EXTRACT_WORKERS", None),
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return cls._process_pool
+
+    @classmethod
+    def _discard_pool(cls, pool: ProcessPoolExecutor):
+        with cls._pool_lock:
+            if cls._process_pool is pool:
+                cls._process_pool = None
+        pool.shutdown(wait=False)
+
+    @staticmethod
+    async def _aget(
+        client: httpx.AsyncClient, url: str, timeout: Optional[int] = None
+    ) -> dict:
+        """UrlFetcher.get 的异步版本，共用磁盘 HTTP 缓存与响应体大小上限"""
+        max_bytes = UrlFetcher._config("MAX_BYTES", 5 * 1024 * 1024)
+        cache = HttpCache.from_config()
+        cached = cache.get(url) if cache else None
+        if cached and cached["fresh"]:
+            logger.info(f"[WebExtract] 命中 HTTP 缓存: {url}")
+            return {"from_cache": True, **cached}
+
+        headers = dict(UrlFetcher.HEADERS)
+        if cached and cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        async with client.stream(
+            "GET", url, headers=headers, timeout=timeout
+        ) as response:
+            logger.info(f"[WebExtract] 状态码: {response.status_code} {url}")
+            if response.status_code == 304 and cached:
+                cache.refresh(url, response.headers)
+                return {"from_cache": True, **cached}
             response.raise_for_status()
-            logger.info(f"[WebExtract] 状态码: {response.status_code}")
 
-            # Step 2: 自动检测编码
-            detected = chardet.detect(response.content)
-            encoding = detected["encoding"] or "utf-8"
-            logger.info(f"[WebExtract] 检测编码: {encoding}")
+            length = response.headers.get("Content-Length", "")
+            if length.isdigit() and int(length) > max_bytes:
+                raise ValueError(f"响应体过大: {length} 字节 > {max_bytes}")
+            chunks, total = [], 0
+            async for chunk in response.aiter_bytes(64 * 1024):
+                total += len(chunk)
+                if total > max_bytes:
+                    raise ValueError(f"响应体超过上限 {max_bytes} 字节，已中止下载")
+                chunks.append(chunk)
+
+            content = b"".join(chunks)
+            if cache:
+                cache.set(url, response.headers, content)
+            return {
+                "content": content,
+                "content_type": response.headers.get("Content-Type"),
+                "from_cache": False,
+            }
+
+    @staticmethod
+    async def fetch_many(
+        urls: Iterable[str],
+        concurrency: int = 16,
+        per_host_limit: int = 4,
+        timeout: Optional[int] = None,
+    ) -> AsyncIterator[dict]:
+        """
+        并发抓取多个 URL 并提取正文，按完成顺序逐个产出结果。
+
+        - 全局并发数与单个域名的并发数分别由 Semaphore 限制；
+        - 解码与 readability / trafilatura 提取放到进程池执行，不阻塞事件循环；
+        - 单个 URL 失败不影响其他 URL，错误信息放在结果的 error 字段中。
+
+        参数：
+            urls: 网页地址（重复的地址只抓取一次）
+            concurrency: 同时在途的请求数上限
+            per_host_limit: 同一域名同时在途的请求数上限
+            timeout: 单个请求超时时间（秒），默认读取 url_fetcher.timeout
 
-            html = response.content.decode(encoding, errors="replace")
+        返回：
+            异步迭代器，每项为 {"url": ..., "text": 正文, "from_cache": bool,
+            "error": 错误信息或 None}。
 
-            # Step 3: 使用 readability 提取正文
+        示例：
+            async for result in UrlFetcher.fetch_many(urls):
+                ...
+        """
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return
+
+        timeout = timeout or UrlFetcher._config("TIMEOUT", 10)
+        global_limit = asyncio.Semaphore(concurrency)
+        host_limits = {}
+        loop = asyncio.get_running_loop()
+        pool = UrlFetcher._extract_pool()
+
+        async def fetch_one(client: httpx.AsyncClient, url: str) -> dict:
+            host = urlsplit(url).netloc.lower()
+            host_limit = host_limits.setdefault(host, asyncio.Semaphore(per_host_limit))
             try:
-                doc = Document(html)
-                summary_html = doc.summary()
-                text = BeautifulSoup(summary_html, "html.parser").get_text(
-                    separator="\n", strip=True
+                async with host_limit, global_limit:
+                    result = await UrlFetcher._aget(client, url, timeout)
+                text = await loop.run_in_executor(
+                    pool,
+                    _extract_page,
+                    result["content"],
+                    result["content_type"],
+                    url,
                 )
-
-                if text and len(text.split()) > 30:
-                    logger.info(
-                        f"[WebExtract] 使用 readability 提取成功，字符数：{len(text)}"
-                    )
-                    return text
-                else:
-                    logger.warning(
-                        "[WebExtract] readability 提取内容为空或过短，尝试使用 trafilatura"
-                    )
+                return {
+                    "url": url,
+                    "text": text,
+                    "from_cache": result["from_cache"],
+                    "error": None,
+                }
             except Exception as e:
-                logger.warning(f"[WebExtract] readability 提取失败: {e}")
+                if isinstance(e, BrokenProcessPool):
+                    # 子进程异常退出后进程池不可再用，下次调用时重建
+                    UrlFetcher._discard_pool(pool)
+                logger.error(f"[WebExtract] 抓取失败 {url}: {e}")
+                return {"url": url, "text": "", "from_cache": False, "error": str(e)}
 
-            # Step 4: fallback 到 trafilatura 提取
+        async with httpx.AsyncClient(
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=concurrency, max_keepalive_connections=concurrency
+            ),
+        ) as client:
+            tasks = [asyncio.create_task(fetch_one(client, url)) for url in urls]
             try:
-                extracted = trafilatura.extract(
-                    html, include_comments=False, include_tables=False
+                for task in asyncio.as_completed(tasks):
+                    yield await task
+            finally:
+                # 调用方提前结束迭代时取消剩余请求
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    def _board_text(tree, url: Optional[str]) -> str:
+        host = (urlsplit(url).hostname or "") if url else ""
+        for domain, xpaths in JOB_BOARD_RULES.items():
+            if host != domain and not host.endswith("." + domain):
+                continue
+            for xpath in xpaths:
+                lines = [
+                    line
+                    for element in tree.xpath(xpath)
+                    for line in _text_lines(element)
+                ]
+                if lines:
+                    return "\n".join(lines)
+        return ""
+
+    @staticmethod
+    def extract_text(html: str, url: Optional[str] = None) -> str:
+        """
+        从 HTML 中提取正文。
+
+        页面只用 lxml 解析一次，各提取器共享同一棵 DOM 树：
+        招聘网站规则（JOB_BOARD_RULES）→ readability → trafilatura。
+
+        参数：
+            html: 已解码的网页 HTML
+            url: 网页地址，用于匹配招聘网站规则与补全相对链接
+
+        返回：
+            正文文本，提取失败时返回空字符串。
+        """
+        try:
+            tree = lxml.html.document_fromstring(
+                html.encode("utf-8"), parser=_html_parser()
+            )
+        except Exception as e:
+            logger.warning(f"[WebExtract] HTML 解析失败: {e}")
+            return ""
+
+        # Step 1: 已知招聘网站直接按 XPath 取职位描述
+        text = UrlFetcher._board_text(tree, url)
+        if text:
+            logger.info(f"[WebExtract] 使用招聘网站规则提取成功，字符数：{len(text)}")
+            return text
+
+        # Step 2: readability 会修改传入的树，使用副本
+        try:
+            summary_html = Document(copy.deepcopy(tree), url=url).summary(
+                html_partial=True
+            )
+            text = "\n".join(_text_lines(lxml.html.fragment_fromstring(summary_html)))
+
+            if text and len(text.split()) > 30:
+                logger.info(
+                    f"[WebExtract] 使用 readability 提取成功，字符数：{len(text)}"
                 )
-                if extracted:
-                    logger.info(
-                        f"[WebExtract] 使用 trafilatura 提取成功，字符数：{len(extracted)}"
-                    )
-                    return extracted.strip()
-                else:
-                    logger.warning("[WebExtract] trafilatura 也未能提取有效正文")
-            except Exception as e:
-                logger.error(f"[WebExtract] trafilatura 提取失败: {e}")
+                return text
+            else:
+                logger.warning(
+                    "[WebExtract] readability 提取内容为空或过短，尝试使用 trafilatura"
+                )
+        except Exception as e:
+            logger.warning(f"[WebExtract] readability 提取失败: {e}")
 
-        except requests.RequestException as e:
-            logger.error(f"[WebExtract] 请求异常: {e}")
+        # Step 3: fallback 到 trafilatura，直接复用已解析的树
+        try:
+            extracted = trafilatura.extract(
+                tree, url=url, include_comments=False, include_tables=False
+            )
+            if extracted:
+                logger.info(
+                    f"[WebExtract] 使用 trafilatura 提取成功，字符数：{len(extracted)}"
+                )
+                return extracted.strip()
+            else:
+                logger.warning("[WebExtract] trafilatura 也未能提取有效正文")
         except Exception as e:
-            logger.error(f"[WebExtract] 未知异常: {e}")
+            logger.error(f"[WebExtract] trafilatura 提取失败: {e}")
 
         return ""
+
+
+if __name__ == "__main__":
+    # 编码识别基准：在保存的招聘页面上对比整页 chardet 与 resolve_encoding 的耗时与结果
+    import glob
+    import os
+    import timeit
+
+    pages_dir = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "..", "tests", "data", "pages"
+    )
+    for path in sorted(glob.glob(os.path.join(pages_dir, "*.html"))):
+        with open(path, "rb") as f:
+            content = f.read()
+        detected = chardet.detect(content)["encoding"] or "utf-8"
+        resolved = UrlFetcher.resolve_encoding(content, "text/html")
+        full = timeit.timeit(lambda: chardet.detect(content), number=20) / 20
+        cheap = (
+            timeit.timeit(
+                lambda: UrlFetcher.resolve_encoding(content, "text/html"), number=20
+            )
+            / 20
+        )
+        print(
+            f"{os.path.basename(path):<20} {len(content) / 1024:5.1f} KB  "
+            f"chardet 全文 {full * 1000:7.2f} ms ({detected})  "
+            f"resolve_encoding {cheap * 1000:6.3f} ms ({resolved})"
+        )
@@ -0,0 +1,9 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 部分模块以 resumix/ 为根导入（如 section.section_base），与 app 的运行方式保持一致
+for path in (ROOT, os.path.join(ROOT, "resumix")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,86 @@
+import json
+
+from resumix.modules.score_module.score_module import ScoreModule
+from resumix.pipeline.batch_pipeline import BatchPipeline
+from resumix.section.section_base import SectionBase
+
+JD_SECTIONS = {"requirements_basic": SectionBase("requirements_basic", "熟悉 Python")}
+SCORE = {"Relevance": 8, "Comment": "ok"}
+
+
+def make_pipeline(tmp_path, fail_paths, processed):
+    pipeline = BatchPipeline(JD_SECTIONS, str(tmp_path / "results.jsonl"))
+
+    def extract(job):
+        processed.append(job["path"])
+        job["text"] = f"text of {job['path']}"
+        return job
+
+    def parse(job):
+        job["sections"] = {"skills": SectionBase("skills", job.pop("text"))}
+        return job
+
+    def score(job):
+        if job["path"] in fail_paths:
+            raise ValueError("段落评分失败: skills")
+        job["scores"] = {"skills": SCORE}
+        return job
+
+    pipeline._extract, pipeline._parse, pipeline._score = extract, parse, score
+    return pipeline
+
+
+def read_records(tmp_path):
+    with open(tmp_path / "results.jsonl", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_rerun_retries_only_failed_resumes(tmp_path):
+    paths = ["a.pdf", "b.pdf", "c.pdf"]
+
+    processed = []
+    summary = make_pipeline(tmp_path, {"b.pdf"}, processed).run(paths)
+    assert sorted(processed) == paths
+    assert (summary["ok"], summary["error"]) == (2, 1)
+
+    # 模拟上次中断时写了一半的行
+    with open(tmp_path / "results.jsonl", "a", encoding="utf-8") as f:
+        f.write('{"resume": "c.pdf", "sta')
+
+    processed = []
+    pipeline = make_pipeline(tmp_path, set(), processed)
+    summary = pipeline.run(paths)
+    assert processed == ["b.pdf"]
+    assert (summary["skipped"], summary["ok"], summary["error"]) == (2, 1, 0)
+    assert pipeline.completed() == set(paths)
+
+    processed = []
+    summary = make_pipeline(tmp_path, set(), processed).run(paths)
+    assert processed == []
+    assert summary["skipped"] == 3
+
+
+def test_unsupported_sections_are_skipped_not_failed(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        ScoreModule,
+        "score_resume_batch",
+        lambda self, sections, basic, preferred: {
+            name: SCORE for name in sections if ScoreModule.is_scorable(name)
+        },
+    )
+    pipeline = BatchPipeline(JD_SECTIONS, str(tmp_path / "results.jsonl"))
+    pipeline._extract = lambda job: job
+    pipeline._parse = lambda job: {
+        **job,
+        "sections": {
+            "skills": SectionBase("skills", "Python"),
+            "hobbies": SectionBase("hobbies", "篮球"),
+        },
+    }
+
+    summary = pipeline.run(["a.pdf"])
+
+    assert (summary["ok"], summary["error"]) == (1, 0)
+    (record,) = read_records(tmp_path)
+    assert record["scores"] == {"skills": SCORE}
+    assert record["skipped_sections"] == ["hobbies"]
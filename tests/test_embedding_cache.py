@@ -0,0 +1,42 @@
+import pytest
+
+from resumix.section_parser.sample_texts import SAMPLE_JD, SAMPLE_RESUME
+from resumix.utils.embedding_cache import LineEmbeddingCache
+
+
+@pytest.fixture(scope="module")
+def parser():
+    from resumix.section_parser.vector_parser import VectorParser
+
+    try:
+        parser = VectorParser()
+    except OSError as e:
+        pytest.skip(f"向量模型不可用: {e}")
+    if parser.line_cache is None:
+        pytest.skip("embedding.line_cache 未启用")
+    return parser
+
+
+def sample_lines(parser):
+    lines = parser.normalize_text(SAMPLE_RESUME) + parser.normalize_text(SAMPLE_JD)
+    # 归一化后与原行相同的变体，会共用原行的缓存向量
+    variants = [f"  {line}　" for line in lines[:10]]
+    return lines + variants
+
+
+def test_cached_and_uncached_classifications_agree(parser, monkeypatch):
+    lines = sample_lines(parser)
+    cache = LineEmbeddingCache(parser.model, "test-model")
+    monkeypatch.setattr(parser, "line_cache", cache)
+
+    cold = parser.classify_lines(lines)
+    warm = parser.classify_lines(lines)
+    assert cache.stats()["hits"] > 0
+
+    monkeypatch.setattr(parser, "line_cache", None)
+    uncached = parser.classify_lines(lines)
+
+    for line, a, b, c in zip(lines, cold, warm, uncached):
+        assert a[0] == b[0] == c[0], line
+        assert a[1] == pytest.approx(c[1], abs=1e-2), line
+        assert b[1] == pytest.approx(c[1], abs=1e-2), line
@@ -0,0 +1,83 @@
+import random
+
+import pytest
+
+from resumix.section_parser.jd_section_labels import JDSectionLabels
+from resumix.section_parser.keyword_matcher import KeywordMatcher
+from resumix.section_parser.sample_texts import SAMPLE_JD, SAMPLE_RESUME
+from resumix.section_parser.section_labels import SectionLabels
+
+
+def linear_find(section_labels, line):
+    """改用自动机之前的做法：按 tag / 关键词顺序逐个做子串判断"""
+    for tag, keywords in section_labels.items():
+        for kw in keywords:
+            if kw.lower() in line.lower():
+                return tag, kw
+    return None
+
+
+def sample_lines():
+    lines = [line.strip() for line in (SAMPLE_RESUME + SAMPLE_JD).splitlines()]
+    return [line for line in lines if line] + [
+        "",
+        "教育背景 / Work Experience",
+        "项目经历与专业技能",
+        "SKILLS & AWARDS",
+    ]
+
+
+@pytest.mark.parametrize(
+    "section_labels",
+    [SectionLabels.get_labels(), JDSectionLabels.get_labels()],
+    ids=["resume", "jd"],
+)
+def test_matches_linear_loop_on_sample_lines(section_labels):
+    matcher = KeywordMatcher(section_labels)
+    for line in sample_lines():
+        assert matcher.find(line) == linear_find(section_labels, line), line
+
+
+def test_overlapping_keywords_keep_tag_and_keyword_priority():
+    # 关键词互为前缀 / 后缀 / 子串，且低优先级的关键词在行内出现得更早
+    section_labels = {
+        "experience": ["work experience", "experience"],
+        "projects": ["project experience", "project"],
+        "skills": ["skill", "skills", "ill"],
+        "education": ["教育", "教育背景"],
+        "awards": ["背景", "奖"],
+    }
+    matcher = KeywordMatcher(section_labels)
+    lines = [
+        "Project Experience",
+        "project work experience",
+        "Skills",
+        "billing",
+        "教育背景",
+        "背景调查与获奖",
+        "个人奖项",
+        "nothing here",
+    ]
+    for line in lines:
+        assert matcher.find(line) == linear_find(section_labels, line), line
+
+
+def test_matches_linear_loop_on_random_overlapping_keywords():
+    rng = random.Random(0)
+    alphabet = "abc教育"
+
+    def word(max_len):
+        return "".join(rng.choice(alphabet) for _ in range(rng.randint(1, max_len)))
+
+    for _ in range(200):
+        section_labels = {
+            f"tag{t}": [word(4) for _ in range(rng.randint(1, 4))]
+            for t in range(rng.randint(1, 4))
+        }
+        matcher = KeywordMatcher(section_labels)
+        for _ in range(20):
+            line = word(12)
+            assert matcher.find(line) == linear_find(section_labels, line), (
+                section_labels,
+                line,
+            )
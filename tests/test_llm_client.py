@@ -0,0 +1,145 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from resumix.utils import llm_client
+from resumix.utils.llm_client import AsyncLLMClient, LLMClient
+
+LIMIT = 3
+
+
+class InFlight:
+    def __init__(self):
+        self.current = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def enter(self):
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def exit(self):
+        with self._lock:
+            self.current -= 1
+
+
+class FakeStreamResponse:
+    ok = True
+
+    def __init__(self, in_flight):
+        self.in_flight = in_flight
+
+    def __enter__(self):
+        self.in_flight.enter()
+        return self
+
+    def __exit__(self, *exc):
+        self.in_flight.exit()
+
+    def iter_lines(self, decode_unicode=False):
+        time.sleep(0.05)
+        yield '{"response": "ok", "done": true}'
+
+
+class FakeAsyncResponse:
+    def __init__(self, status_code=200):
+        self.status_code = status_code
+        self.is_success = status_code < 400
+        self.text = "boom"
+
+    def json(self):
+        return {"response": "ok"}
+
+
+class FakeAsyncClient:
+    def __init__(self, in_flight, status_code=200):
+        self.in_flight = in_flight
+        self.status_code = status_code
+
+    async def post(self, url, json=None, headers=None):
+        self.in_flight.enter()
+        try:
+            await asyncio.sleep(0.05)
+            return FakeAsyncResponse(self.status_code)
+        finally:
+            self.in_flight.exit()
+
+
+class FakeCache:
+    def __init__(self):
+        self.stored = {}
+
+    def get(self, key):
+        return self.stored.get(key)
+
+    def set(self, key, response):
+        self.stored[key] = response
+
+
+@pytest.fixture
+def clients(monkeypatch):
+    # 使用独立的后端名，避免与其他测试共享 ProviderLimiter
+    monkeypatch.setitem(llm_client.LLM_CONFIG, "type", "test-limiter")
+    monkeypatch.setitem(llm_client.LLM_CONFIG, "max_concurrency", LIMIT)
+    sync_client = LLMClient()
+    async_client = AsyncLLMClient()
+    monkeypatch.setattr(sync_client, "cache", None)
+    return sync_client, async_client
+
+
+def test_sync_async_and_stream_share_one_limit(clients, monkeypatch):
+    sync_client, async_client = clients
+    in_flight = InFlight()
+
+    def fake_generate(self, prompt):
+        in_flight.enter()
+        try:
+            time.sleep(0.05)
+            return "ok"
+        finally:
+            in_flight.exit()
+
+    monkeypatch.setattr(LLMClient, "_generate", fake_generate)
+    monkeypatch.setattr(
+        sync_client.session, "post", lambda *a, **kw: FakeStreamResponse(in_flight)
+    )
+    monkeypatch.setattr(
+        AsyncLLMClient, "_get_client", lambda self: FakeAsyncClient(in_flight)
+    )
+
+    def run_async():
+        return asyncio.run(async_client.agenerate_many([f"a{i}" for i in range(8)]))
+
+    with ThreadPoolExecutor(max_workers=17) as pool:
+        futures = [pool.submit(sync_client.generate, f"s{i}") for i in range(8)]
+        futures += [
+            pool.submit(lambda p: "".join(sync_client.stream(p)), f"t{i}")
+            for i in range(8)
+        ]
+        futures.append(pool.submit(run_async))
+        results = [future.result() for future in futures]
+
+    assert results[:16] == ["ok"] * 16
+    assert results[16] == ["ok"] * 8
+    assert in_flight.peak == LIMIT
+    assert in_flight.current == 0
+
+
+def test_agenerate_does_not_cache_error_responses(clients, monkeypatch):
+    sync_client, async_client = clients
+    cache = FakeCache()
+    monkeypatch.setattr(sync_client, "cache", cache)
+    monkeypatch.setattr(
+        AsyncLLMClient,
+        "_get_client",
+        lambda self: FakeAsyncClient(InFlight(), status_code=500),
+    )
+
+    response = asyncio.run(async_client.agenerate("prompt"))
+
+    assert response.startswith("❌ Error: 500")
+    assert cache.stored == {}
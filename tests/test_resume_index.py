@@ -0,0 +1,90 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from resumix.pipeline.resume_index import ResumeIndex
+from resumix.section.section_base import SectionBase
+from resumix.utils import embedding_registry
+from resumix.utils.embedding_registry import EmbeddingRegistry
+
+
+class FakeModel:
+    """按文本哈希生成固定向量，避免测试下载真实模型"""
+
+    def __init__(self, dim):
+        self.dim = dim
+
+    def get_sentence_embedding_dimension(self):
+        return self.dim
+
+    def encode(self, texts, normalize_embeddings=False, **kwargs):
+        rows = [
+            np.random.default_rng(abs(hash(text)) % 2**32).normal(size=self.dim)
+            for text in texts
+        ]
+        vectors = np.asarray(rows, dtype=np.float32)
+        if normalize_embeddings:
+            vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors
+
+
+@pytest.fixture
+def model(monkeypatch):
+    model = FakeModel(dim=16)
+    monkeypatch.setattr(
+        EmbeddingRegistry,
+        "get_model",
+        classmethod(lambda cls, name, backend=None: model),
+    )
+    return model
+
+
+@pytest.fixture
+def saved(tmp_path, model):
+    index = ResumeIndex(model_name="fake-model", use_ann=False)
+    index.add("alice", {"skills": SectionBase("skills", "Python\nPyTorch")})
+    index.add("bob", {"skills": SectionBase("skills", "Java\nSpring")})
+    index.save(str(tmp_path))
+    return str(tmp_path)
+
+
+def test_save_records_model_key_and_dim(saved):
+    with open(os.path.join(saved, "meta.json"), encoding="utf-8") as f:
+        meta = json.load(f)
+    assert meta["model_key"] == EmbeddingRegistry.model_key("fake-model")
+    assert meta["dim"] == 16
+
+    index = ResumeIndex.load(saved, use_ann=False)
+    assert index.resume_ids == ["alice", "bob"]
+
+
+def test_load_rejects_other_model(saved):
+    with pytest.raises(ValueError):
+        ResumeIndex.load(saved, use_ann=False, model_name="other-model")
+
+
+def test_load_rejects_other_backend(saved, monkeypatch):
+    monkeypatch.setattr(
+        embedding_registry.CONFIG.EMBEDDING, "BACKEND", "onnx", raising=False
+    )
+    with pytest.raises(ValueError):
+        ResumeIndex.load(saved, use_ann=False)
+
+
+def test_load_rejects_dim_mismatch(saved, model):
+    model.dim = 32
+    with pytest.raises(ValueError):
+        ResumeIndex.load(saved, use_ann=False)
+
+
+def test_load_rejects_index_without_model_info(saved):
+    meta_path = os.path.join(saved, "meta.json")
+    with open(meta_path, encoding="utf-8") as f:
+        meta = json.load(f)
+    del meta["model_key"], meta["dim"]
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    with pytest.raises(ValueError):
+        ResumeIndex.load(saved, use_ann=False)
@@ -0,0 +1,48 @@
+import json
+
+from resumix.modules.score_module.score_module import ScoreModule
+from resumix.section.section_base import SectionBase
+
+SCORE = {
+    "Completeness": 8,
+    "Clarity": 7,
+    "Relevance": 9,
+    "ProfessionalLanguage": 8,
+    "AchievementOriented": 6,
+    "QuantitativeSupport": 5,
+    "Comment": "ok",
+}
+
+
+class FakeLLM:
+    """批量 prompt 返回无法解析的内容，迫使每个段落走单段回退"""
+
+    def __init__(self):
+        self.prompts = []
+
+    def __call__(self, prompt):
+        self.prompts.append(prompt)
+        if "## Resume Sections:" in prompt:
+            return "not json"
+        return json.dumps(SCORE)
+
+
+def test_batch_fallback_scores_awards_and_skips_unknown_sections():
+    module = ScoreModule()
+    module.llm = FakeLLM()
+    sections = {
+        "skills": SectionBase("skills", "Python, PyTorch"),
+        "awards": SectionBase("awards", "ACM-ICPC 区域赛银牌"),
+        "hobbies": SectionBase("hobbies", "篮球"),
+    }
+
+    results = module.score_resume_batch(
+        sections,
+        SectionBase("requirements_basic", "熟悉 Python"),
+        SectionBase("requirements_preferred", "有竞赛经历"),
+    )
+
+    assert results == {"skills": SCORE, "awards": SCORE}
+    batch_prompt = module.llm.prompts[0]
+    assert "篮球" not in batch_prompt
+    assert "ACM-ICPC" in batch_prompt
@@ -0,0 +1,49 @@
+import os
+
+import chardet
+import pytest
+
+from resumix.utils.url_fetcher import UrlFetcher
+
+PAGES = os.path.join(os.path.dirname(__file__), "data", "pages")
+
+# (文件, Content-Type, 期望编码)
+CASES = [
+    ("gbk_meta.html", "text/html", "gb18030"),
+    ("gbk_meta.html", "text/html; charset=GBK", "gb18030"),
+    ("gbk_no_charset.html", "text/html", "gb18030"),
+    ("utf8_bom.html", "text/html", "utf-8-sig"),
+    ("utf8_bom.html", "text/html; charset=utf-8", "utf-8-sig"),
+    ("no_charset.html", "text/html", "utf-8"),
+    ("no_charset.html", None, "utf-8"),
+]
+
+# GB2312 编解码器把 0xA1A4 映射为 U+30FB，GBK / GB18030 映射为页面原本的 U+00B7
+_GB2312_MIDDLE_DOT = str.maketrans("・", "·")
+
+
+def load(name: str) -> bytes:
+    with open(os.path.join(PAGES, name), "rb") as f:
+        return f.read()
+
+
+def chardet_full_body(content: bytes) -> str:
+    """改用 resolve_encoding 之前的做法：对整个响应体运行 chardet"""
+    encoding = chardet.detect(content)["encoding"] or "utf-8"
+    return content.decode(encoding, errors="replace")
+
+
+@pytest.mark.parametrize("name, content_type, expected", CASES)
+def test_resolve_encoding(name, content_type, expected):
+    assert UrlFetcher.resolve_encoding(load(name), content_type) == expected
+
+
+@pytest.mark.parametrize("name, content_type, expected", CASES)
+def test_decode_html_matches_full_body_chardet(name, content_type, expected):
+    content = load(name)
+    text = UrlFetcher.decode_html(content, content_type)
+
+    assert text == chardet_full_body(content).translate(_GB2312_MIDDLE_DOT)
+    assert "�" not in text
+    # 解码无损：按识别出的编码重新编码后与原始字节一致
+    assert text.encode(expected) == content
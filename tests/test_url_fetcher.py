@@ -0,0 +1,139 @@
+import gzip
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from resumix.utils import url_fetcher
+from resumix.utils.http_cache import HttpCache
+from resumix.utils.url_fetcher import UrlFetcher
+
+PAGE = "<html><body><p>岗位职责：负责推荐系统研发</p></body></html>".encode("utf-8")
+LAST_MODIFIED = "Wed, 01 Oct 2025 08:00:00 GMT"
+MAX_BYTES = 64 * 1024
+
+
+class Handler(BaseHTTPRequestHandler):
+    hits = Counter()
+
+    def log_message(self, *args):
+        pass
+
+    def send_page(self, body, cache_control, **headers):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Cache-Control", cache_control)
+        for name, value in headers.items():
+            self.send_header(name.replace("_", "-"), value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        Handler.hits[self.path] += 1
+        if self.path == "/etag":
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_page(PAGE, "no-cache", ETag='"v1"')
+        elif self.path == "/last-modified":
+            if self.headers.get("If-Modified-Since") == LAST_MODIFIED:
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_page(PAGE, "max-age=0", Last_Modified=LAST_MODIFIED)
+        elif self.path == "/fresh":
+            self.send_page(PAGE, "max-age=60")
+        elif self.path == "/no-store":
+            self.send_page(PAGE, "no-store")
+        elif self.path == "/gzip":
+            self.send_page(gzip.compress(PAGE), "no-store", Content_Encoding="gzip")
+        elif self.path == "/br":
+            import brotli
+
+            self.send_page(brotli.compress(PAGE), "no-store", Content_Encoding="br")
+        elif self.path == "/bomb":
+            # 压缩后很小、解压后远超上限，且不带 Content-Length
+            body = gzip.compress(b"0" * (MAX_BYTES * 16))
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Encoding", "gzip")
+            self.end_headers()
+            self.wfile.write(body)
+        elif self.path == "/oversized":
+            self.send_page(b"0" * (MAX_BYTES + 1), "no-store")
+        else:
+            self.send_error(404)
+
+
+@pytest.fixture
+def server():
+    Handler.hits.clear()
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def cache(tmp_path, monkeypatch):
+    HttpCache.reset()
+    cache = HttpCache(str(tmp_path / "http_cache.db"), max_bytes=1024 * 1024)
+    monkeypatch.setattr(HttpCache, "from_config", classmethod(lambda cls: cache))
+    monkeypatch.setattr(url_fetcher.CONFIG.URL_FETCHER, "MAX_BYTES", MAX_BYTES)
+    yield cache
+    HttpCache.reset()
+
+
+@pytest.mark.parametrize("path", ["/etag", "/last-modified"])
+def test_304_reuses_cached_body(server, path):
+    first = UrlFetcher.get(server + path)
+    second = UrlFetcher.get(server + path)
+
+    assert first["from_cache"] is False
+    assert second["from_cache"] is True
+    assert second["content"] == PAGE
+    # 第二次仍然发出了条件请求，服务端只回 304 不带正文
+    assert Handler.hits[path] == 2
+
+
+def test_max_age_serves_from_cache_without_request(server):
+    UrlFetcher.get(server + "/fresh")
+    again = UrlFetcher.get(server + "/fresh")
+
+    assert again["from_cache"] is True
+    assert again["content"] == PAGE
+    assert Handler.hits["/fresh"] == 1
+
+
+def test_no_store_is_never_cached(server, cache):
+    UrlFetcher.get(server + "/no-store")
+    again = UrlFetcher.get(server + "/no-store")
+
+    assert again["from_cache"] is False
+    assert cache.get(server + "/no-store") is None
+    assert Handler.hits["/no-store"] == 2
+
+
+@pytest.mark.parametrize("path", ["/bomb", "/oversized"])
+def test_size_cap_aborts_oversized_body(server, cache, path):
+    with pytest.raises(ValueError):
+        UrlFetcher.get(server + path)
+    assert cache.get(server + path) is None
+
+
+def test_gzip_is_decoded(server):
+    result = UrlFetcher.get(server + "/gzip")
+    assert result["content"] == PAGE
+    assert "推荐系统" in UrlFetcher.fetch(server + "/gzip")
+
+
+def test_brotli_is_decoded(server):
+    pytest.importorskip("brotli")
+    result = UrlFetcher.get(server + "/br")
+    assert result["content"] == PAGE
+    assert "推荐系统" in UrlFetcher.fetch(server + "/br")